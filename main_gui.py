@@ -2,15 +2,83 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
+import logging
+import logging.handlers
 import smtplib
 import threading
+import queue
+import time
 import os
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import sqlite3
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from email.message import EmailMessage
 from datetime import datetime
 from yaml_config_manager import YAMLConfigManager as ConfigManager
 
+log = logging.getLogger('emailgen')
+
+# SMTP batch sending limits
+SMTP_MESSAGES_PER_CONNECTION = 100   # Rotate sessions to stay under per-connection caps
+SMTP_TRANSIENT_CODES = (421, 450, 454)
+SMTP_MAX_RETRIES = 3
+SMTP_IDLE_CHECK_SECONDS = 30   # NOOP a kept session only after this long unused
+
+# Ollama HTTP connection pool
+HTTP_POOL_SIZE = 8
+
+# Generated email layout: "SUBJECT: ..." line, optional "EMAIL BODY:" label, then the body
+EMAIL_CONTENT_RE = re.compile(
+    r'^SUBJECT:[ \t]*(?P<subject>[^\n]*)\n?(?:[ \t]*EMAIL BODY:[ \t]*\n?)?(?P<body>.*)',
+    re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+
+# Prompt values for blank prospect cells, aligned with PROSPECT_DTYPES column order
+PROSPECT_PROMPT_DEFAULTS = ('N/A', 'N/A', 'Facilities Manager', 'N/A', 'N/A', 'Louisiana', 'N/A')
+
+# Basic shape check for prospect email addresses
+EMAIL_ADDRESS_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Prospect columns shown in the preview tree, in display order
+PREVIEW_COLUMNS = ['Company Name', 'Industry', 'Contact Name', 'Email', 'Location']
+
+# Rotating application log
+LOG_FILE = 'emailgen.log'
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
+
+# Interval between generation progress refreshes
+PROGRESS_POLL_MS = 100
+
+# Sent-email history database
+HISTORY_DB_FILE = 'history.db'
+HISTORY_LOAD_LIMIT = 1000
+
+# Opt-in Parquet copies of loaded CSVs (prospects.parquet_cache), kept with the app's own data
+PROSPECT_CACHE_DIR = '.prospect_cache'
+
+# Rows written per chunk when exporting history to CSV
+EXPORT_CHUNK_ROWS = 10_000
+
+# Rows added to the preview tree per scroll page
+PREVIEW_PAGE_SIZE = 100
+
+# Known prospect CSV schema; every column is free text
+PROSPECT_DTYPES = {
+    'Company Name': 'string',
+    'Industry': 'string',
+    'Contact Name': 'string',
+    'Email': 'string',
+    'Company Size': 'string',
+    'Location': 'string',
+    'Notes': 'string',
+}
+
 class EmailGeneratorGUI:
     def __init__(self, root):
         self.root = root
@@ -21,13 +89,41 @@ class EmailGeneratorGUI:
         # Initialize config manager
         self.config = ConfigManager()
         
+        # Shared HTTP session so Ollama requests reuse keep-alive connections
+        self.http = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({'GET', 'POST'}))
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
         # Data storage
-        self.prospects_data = []
+        self.prospects_df = None
         self.generated_emails = []
         self.current_email_index = 0
         
+        # Generation progress, written by the worker thread and polled by the UI
+        self.gen_progress = None
+        
+        # True while a bulk send runs in the background
+        self.sending_all = False
+        
+        # Persistent, append-only send history
+        self.db = sqlite3.connect(HISTORY_DB_FILE)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS history('
+            'sent_at TEXT, company TEXT, email TEXT, subject TEXT, body TEXT, status TEXT, subject_hash TEXT)'
+        )
+        history_columns = [column[1] for column in self.db.execute('PRAGMA table_info(history)')]
+        if 'subject_hash' not in history_columns:
+            self.db.execute('ALTER TABLE history ADD COLUMN subject_hash TEXT')
+        # (recipient, subject_hash) is the idempotency key for sends
+        self.db.execute('CREATE UNIQUE INDEX IF NOT EXISTS history_sent_once ON history(email, subject_hash)')
+        self.db.commit()
+        
         # Create main interface
         self.create_widgets()
+        self.load_history()
         
         # Check configuration on startup
         self.check_initial_setup()
@@ -78,7 +174,9 @@ class EmailGeneratorGUI:
             self.prospects_tree.column(col, width=150)
         
         scrollbar_prospects = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.prospects_tree.yview)
-        self.prospects_tree.configure(yscrollcommand=scrollbar_prospects.set)
+        self.prospects_tree.configure(yscrollcommand=lambda first, last: self._on_prospects_scroll(scrollbar_prospects, first, last))
+        self.prospects_preview = None
+        self.prospects_loaded = 0
         
         self.prospects_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar_prospects.pack(side=tk.RIGHT, fill=tk.Y)
@@ -196,7 +294,8 @@ class EmailGeneratorGUI:
         export_frame = ttk.Frame(self.results_tab)
         export_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        ttk.Button(export_frame, text="Export History to CSV", command=self.export_history).pack(side=tk.LEFT)
+        self.export_btn = ttk.Button(export_frame, text="Export History to CSV", command=self.export_history)
+        self.export_btn.pack(side=tk.LEFT)
         ttk.Button(export_frame, text="Clear History", command=self.clear_history).pack(side=tk.LEFT, padx=(10, 0))
 
     def check_initial_setup(self):
@@ -215,8 +314,8 @@ class EmailGeneratorGUI:
         
         if file_path:
             try:
-                # Read CSV
-                df = pd.read_csv(file_path)
+                # Read CSV (or its Parquet cache from a previous load)
+                df = self._read_prospects(file_path)
                 
                 # Validate required columns
                 required_columns = ['Company Name', 'Email']
@@ -227,9 +326,27 @@ class EmailGeneratorGUI:
                                        f"Missing required columns: {', '.join(missing_columns)}")
                     return
                 
+                # Normalize schema and drop unusable rows with column-wide operations
+                df = df.reindex(columns=list(PROSPECT_DTYPES), fill_value='').fillna('')
+                loaded_count = len(df)
+                df['Email'] = df['Email'].str.strip().str.lower()
+                df = df[df['Email'].str.match(EMAIL_ADDRESS_RE)]
+                skipped_count = loaded_count - len(df)
+                
+                # One generation and one send per address
+                valid_count = len(df)
+                df = df.drop_duplicates(subset=['Email'], keep='first')
+                duplicate_count = valid_count - len(df)
+                
                 # Store data
-                self.prospects_data = df.to_dict('records')
-                self.file_label.config(text=f"Loaded: {len(self.prospects_data)} prospects")
+                # Keep prospects columnar; rows become dicts only when an email is generated
+                self.prospects_df = df
+                label = f"Loaded: {len(df)} prospects"
+                if skipped_count:
+                    label += f" ({skipped_count} skipped without a valid email)"
+                if duplicate_count:
+                    label += f" ({duplicate_count} duplicate emails removed)"
+                self.file_label.config(text=label)
                 
                 # Update treeview
                 self.update_prospects_tree()
@@ -241,6 +358,38 @@ class EmailGeneratorGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load CSV: {str(e)}")
 
+    def _read_prospects(self, file_path):
+        """Read prospects, preferring a fresh Parquet cache when prospects.parquet_cache is on"""
+        cache_path = None
+        if self.config.get('prospects', 'parquet_cache'):
+            # Never write beside the user's file; one cache entry per source path
+            path_hash = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+            cache_path = os.path.join(PROSPECT_CACHE_DIR, path_hash + '.parquet')
+        if cache_path and os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception as e:
+                log.warning("Ignoring unreadable prospects cache %s: %s", cache_path, e)
+        
+        # Explicit dtypes skip pandas' inference pass; unknown columns are never parsed
+        df = pd.read_csv(
+            file_path,
+            dtype=PROSPECT_DTYPES,
+            usecols=lambda col: col in PROSPECT_DTYPES,
+            engine='c',
+            na_filter=False
+        )
+        
+        # Cache is best-effort; pyarrow may not be installed
+        if cache_path:
+            try:
+                os.makedirs(PROSPECT_CACHE_DIR, exist_ok=True)
+                df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+            except Exception as e:
+                log.warning("Could not write prospects cache %s: %s", cache_path, e)
+        
+        return df
+
     def download_template(self):
         """Download CSV template"""
         template_data = {
@@ -266,24 +415,34 @@ class EmailGeneratorGUI:
 
     def update_prospects_tree(self):
         """Update the prospects treeview"""
-        # Clear existing items
-        for item in self.prospects_tree.get_children():
-            self.prospects_tree.delete(item)
-        
-        # Add new items
-        for prospect in self.prospects_data:
-            values = (
-                prospect.get('Company Name', ''),
-                prospect.get('Industry', ''),
-                prospect.get('Contact Name', ''),
-                prospect.get('Email', ''),
-                prospect.get('Location', '')
-            )
+        # Clear existing items in a single Tk call
+        self.prospects_tree.delete(*self.prospects_tree.get_children())
+        
+        # Rows are inserted a page at a time as the user scrolls
+        self.prospects_preview = self.prospects_df.reindex(columns=PREVIEW_COLUMNS, fill_value='')
+        self.prospects_loaded = 0
+        self._load_more_prospects()
+
+    def _load_more_prospects(self):
+        """Append the next page of prospects to the treeview"""
+        start = self.prospects_loaded
+        stop = min(start + PREVIEW_PAGE_SIZE, len(self.prospects_preview))
+        page = self.prospects_preview.iloc[start:stop]
+        for values in page.itertuples(index=False, name=None):
             self.prospects_tree.insert('', 'end', values=values)
+        self.prospects_loaded = stop
+
+    def _on_prospects_scroll(self, scrollbar, first, last):
+        """Keep the scrollbar in sync and load another page near the bottom"""
+        scrollbar.set(first, last)
+        if (self.prospects_preview is not None
+                and self.prospects_loaded < len(self.prospects_preview)
+                and float(last) >= 0.9):
+            self._load_more_prospects()
 
     def generate_emails(self):
         """Generate emails for all prospects"""
-        if not self.prospects_data:
+        if self.prospects_df is None or self.prospects_df.empty:
             messagebox.showwarning("No Data", "Please upload a CSV file first.")
             return
         
@@ -294,90 +453,146 @@ class EmailGeneratorGUI:
         
         # Disable button and show progress
         self.generate_btn.config(state=tk.DISABLED)
-        self.progress.config(maximum=len(self.prospects_data))
+        self.progress.config(maximum=len(self.prospects_df))
         self.status_label.config(text="Generating emails...")
         
         # Start generation in thread to prevent GUI freezing
+        self.gen_progress = (0, len(self.prospects_df))
         thread = threading.Thread(target=self._generate_emails_thread)
         thread.daemon = True
         thread.start()
+        self._poll_gen_progress()
+
+    def _poll_gen_progress(self):
+        """Refresh generation progress from the worker at a fixed rate"""
+        if self.gen_progress is None:
+            return
+        
+        done, total = self.gen_progress
+        self.progress.config(value=done)
+        self.status_label.config(text=f"Generated email {done}/{total}...")
+        self.root.after(PROGRESS_POLL_MS, self._poll_gen_progress)
 
     def _generate_emails_thread(self):
         """Generate emails in separate thread"""
         self.generated_emails = []
         ollama_config = self.config.get_ollama_config()
-        
-        for i, prospect in enumerate(self.prospects_data):
-            try:
-                # Update progress in main thread
-                self.root.after(0, lambda i=i: self.progress.config(value=i))
-                self.root.after(0, lambda: self.status_label.config(text=f"Generating email {i+1}/{len(self.prospects_data)}..."))
-                
-                # Generate email
-                email_content = self._generate_single_email(prospect, ollama_config)
-                subject, body = self._parse_email_content(email_content)
-                
-                email_data = {
-                    'prospect': prospect,
-                    'subject': subject,
-                    'body': body,
-                    'generated_at': datetime.now().isoformat(),
-                    'sent': False
-                }
-                
-                self.generated_emails.append(email_data)
-                
-            except Exception as e:
-                print(f"Error generating email for {prospect.get('Company Name', 'Unknown')}: {e}")
+        prompt_template = self._build_prompt_template(self.config.get_company_info())
+        df = self.prospects_df
+        columns = list(df.columns)
+        total = len(df)
+        # ollama.max_workers is the client's request count; ollama.parallel (the server's
+        # OLLAMA_NUM_PARALLEL) only caps it, since extra requests just queue server-side
+        max_workers = max(1, int(ollama_config.get('max_workers') or 4))
+        if ollama_config.get('parallel'):
+            max_workers = max(1, min(max_workers, int(ollama_config['parallel'])))
+        
+        # Results are slotted by prospect index so output order matches the CSV
+        results = [None] * total
+        completed = 0
+        
+        # Submissions are windowed so a large file never queues every prospect at once
+        window = max_workers * 2
+        pending_rows = enumerate(df.itertuples(index=False, name=None))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_prospect = {}
+            
+            def top_up():
+                for i, row in islice(pending_rows, window - len(future_to_prospect)):
+                    prospect = dict(zip(columns, row))
+                    future = executor.submit(self._generate_email_data, prospect, row, ollama_config, prompt_template)
+                    future_to_prospect[future] = (i, prospect)
+            
+            top_up()
+            while future_to_prospect:
+                done, _ = wait(future_to_prospect, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, prospect = future_to_prospect.pop(future)
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        log.error("Error generating email for %s: %s", prospect.get('Company Name', 'Unknown'), e)
+                    
+                    # Picked up by _poll_gen_progress; a tuple swap is atomic
+                    completed += 1
+                    self.gen_progress = (completed, total)
+                top_up()
+        
+        self.generated_emails = [email_data for email_data in results if email_data is not None]
         
         # Update UI in main thread
         self.root.after(0, self._generation_complete)
 
-    def _generate_single_email(self, prospect, ollama_config):
+    def _generate_email_data(self, prospect, row, ollama_config, prompt_template):
+        """Generate and parse the email for one prospect"""
+        email_content = self._generate_single_email(row, ollama_config, prompt_template)
+        subject, body = self._parse_email_content(email_content)
+        
+        return {
+            'prospect': prospect,
+            'subject': subject,
+            'body': body,
+            'generated_at': datetime.now().isoformat(),
+            'sent': False
+        }
+
+    def _generate_single_email(self, row, ollama_config, prompt_template):
         """Generate a single email using Ollama"""
-        prompt = self._create_email_prompt(prospect)
+        prompt = self._create_email_prompt(row, prompt_template)
         
         payload = {
             "model": ollama_config['model'],
             "prompt": prompt,
-            "stream": False
+            "stream": True
         }
         
-        response = requests.post(
+        # Read the NDJSON stream chunk by chunk instead of buffering one large body
+        with self.http.post(
             ollama_config['url'], 
             json=payload, 
-            timeout=ollama_config['timeout']
-        )
-        
-        if response.status_code == 200:
-            return response.json()["response"]
-        else:
-            raise Exception(f"Ollama API error: {response.status_code}")
+            timeout=ollama_config['timeout'],
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(f"Ollama API error: {response.status_code}")
+            
+            chunks = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                chunks.append(data.get("response", ""))
+                if data.get("done"):
+                    break
+        
+        return ''.join(chunks)
 
-    def _create_email_prompt(self, prospect):
-        """Create email generation prompt"""
-        company_info = self.config.get_company_info()
+    def _build_prompt_template(self, company_info):
+        """Build the email prompt once per batch, leaving positional slots for the prospect row"""
+        def literal(value):
+            return str(value).replace('{', '{{').replace('}', '}}')
         
         return f"""
 Write a professional, personalized email for a cleaning company to send to a potential business client.
 
 CLEANING COMPANY DETAILS:
-- Company: {company_info['name']}
-- Website: {company_info['website']}
-- Location: {company_info['location']}
-- Phone: {company_info['phone']}
-- Services: {', '.join(company_info['services'])}
-- Experience: {company_info['years_experience']} years
-- Certifications: {', '.join(company_info['certifications'])}
+- Company: {literal(company_info['name'])}
+- Website: {literal(company_info['website'])}
+- Location: {literal(company_info['location'])}
+- Phone: {literal(company_info['phone'])}
+- Services: {literal(', '.join(company_info['services']))}
+- Experience: {literal(company_info['years_experience'])} years
+- Certifications: {literal(', '.join(company_info['certifications']))}
 
 PROSPECT DETAILS:
-- Company Name: {prospect.get('Company Name', 'N/A')}
-- Industry: {prospect.get('Industry', 'N/A')}
-- Contact Name: {prospect.get('Contact Name', 'Facilities Manager')}
-- Email: {prospect.get('Email', 'N/A')}
-- Company Size: {prospect.get('Company Size', 'N/A')}
-- Location: {prospect.get('Location', 'Louisiana')}
-- Notes: {prospect.get('Notes', 'N/A')}
+- Company Name: {{0}}
+- Industry: {{1}}
+- Contact Name: {{2}}
+- Email: {{3}}
+- Company Size: {{4}}
+- Location: {{5}}
+- Notes: {{6}}
 
 FORMAT REQUIREMENTS:
 1. Start with: SUBJECT: [compelling subject line]
@@ -393,24 +608,22 @@ FORMAT REQUIREMENTS:
 Generate the complete email with subject and body clearly separated.
 """
 
+    def _create_email_prompt(self, row, prompt_template):
+        """Create email generation prompt from a prospect row in PROSPECT_DTYPES order"""
+        return prompt_template.format(*[value or default for value, default in zip(row, PROSPECT_PROMPT_DEFAULTS)])
+
     def _parse_email_content(self, content):
         """Parse generated email content"""
-        lines = content.strip().split('\n')
-        subject = ""
-        body = ""
-        
-        for i, line in enumerate(lines):
-            if line.upper().startswith('SUBJECT:'):
-                subject = line.replace('SUBJECT:', '').strip()
-                body_lines = lines[i+1:]
-                if body_lines and body_lines[0].upper().startswith('EMAIL BODY:'):
-                    body_lines = body_lines[1:]
-                body = '\n'.join(body_lines).strip()
-                break
-        
-        if not subject and lines:
-            subject = lines[0].strip()
-            body = '\n'.join(lines[1:]).strip()
+        content = content.strip()
+        
+        match = EMAIL_CONTENT_RE.search(content)
+        if match:
+            subject = match.group('subject').strip()
+            body = match.group('body').strip()
+        else:
+            subject, _, body = content.partition('\n')
+            subject = subject.strip()
+            body = body.strip()
         
         if not subject:
             subject = "Professional Cleaning Services - Fresh Start Cleaning Co."
@@ -419,7 +632,8 @@ Generate the complete email with subject and body clearly separated.
 
     def _generation_complete(self):
         """Called when email generation is complete"""
-        self.progress.config(value=len(self.prospects_data))
+        self.gen_progress = None
+        self.progress.config(value=len(self.prospects_df))
         self.status_label.config(text=f"Generated {len(self.generated_emails)} emails")
         self.generate_btn.config(state=tk.NORMAL)
         
@@ -481,7 +695,7 @@ Generate the complete email with subject and body clearly separated.
             if success:
                 email['sent'] = True
                 email['sent_at'] = datetime.now().isoformat()
-                self.update_history()
+                self.record_sent_email(email)
                 messagebox.showinfo("Success", "Email sent successfully!")
             else:
                 messagebox.showerror("Error", "Failed to send email.")
@@ -492,48 +706,215 @@ Generate the complete email with subject and body clearly separated.
             messagebox.showwarning("No Emails", "No emails to send.")
             return
         
+        if self.sending_all:
+            messagebox.showinfo("Sending", "A bulk send is already in progress.")
+            return
+        
         unsent_count = sum(1 for email in self.generated_emails if not email['sent'])
         
         if messagebox.askyesno("Confirm Send All", 
                               f"Send {unsent_count} unsent emails?"):
             
-            sent_count = 0
+            # Read settings once for the whole batch
+            email_config = self.config.get_email_config()
+            company_info = self.config.get_company_info()
+            concurrency = max(1, int(email_config.get('concurrency', 5)))
+            
+            # Each worker owns its own persistent SMTP session and pulls from a shared queue
+            work_queue = queue.Queue()
+            already_sent = 0
             for email in self.generated_emails:
-                if not email['sent']:
-                    if self._send_email(email):
+                if email['sent']:
+                    continue
+                # Skip anything a previous (possibly interrupted) batch already delivered
+                if self.was_already_sent(email):
+                    email['sent'] = True
+                    already_sent += 1
+                    continue
+                work_queue.put(email)
+            
+            # Workers are started and joined off the Tk thread; results come back via root.after
+            total = work_queue.qsize()
+            self.status_label.config(text=f"Sending 0/{total}...")
+            self.sending_all = True
+            thread = threading.Thread(
+                target=self._send_all_thread,
+                args=(work_queue, total, unsent_count, already_sent, email_config, company_info, concurrency),
+                daemon=True
+            )
+            thread.start()
+
+    def _send_all_thread(self, work_queue, total, unsent_count, already_sent, email_config, company_info, concurrency):
+        """Run the send workers and hand the outcome back to the Tk thread"""
+        lock = threading.Lock()
+        sent_emails = []
+        stop = threading.Event()   # Set on a login failure so no worker keeps retrying bad credentials
+        progress = lambda: self.root.after(0, self._send_progress, len(sent_emails), total)
+        # Senders record each delivery right away on their own connection (used under `lock`),
+        # so a crash or close mid-batch never loses history and causes resends
+        history_db = sqlite3.connect(HISTORY_DB_FILE, check_same_thread=False)
+        workers = [
+            threading.Thread(target=self._send_worker,
+                             args=(work_queue, lock, sent_emails, email_config, company_info, stop, progress,
+                                   history_db),
+                             daemon=True)
+            for _ in range(min(concurrency, total))
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            history_db.close()
+        self.root.after(0, self._send_all_complete, sent_emails, unsent_count, already_sent, stop.is_set())
+
+    def _send_progress(self, sent, total):
+        """Show bulk send progress"""
+        self.status_label.config(text=f"Sending {sent}/{total}...")
+
+    def _send_all_complete(self, sent_emails, unsent_count, already_sent, auth_failed):
+        """Record a finished bulk send and report it"""
+        self.sending_all = False
+        self.status_label.config(text=f"Sent {len(sent_emails)} emails")
+        summary = f"Sent {len(sent_emails)} out of {unsent_count} emails."
+        if already_sent:
+            summary += f"\nSkipped {already_sent} already sent in a previous batch."
+        if auth_failed:
+            summary += "\nStopped early: the SMTP login was rejected. Check the email settings."
+        messagebox.showinfo("Complete", summary)
+
+    def _send_worker(self, work_queue, lock, sent_emails, email_config, company_info, stop, progress, history_db):
+        """Drain the send queue over a single SMTP session, rotating it periodically"""
+        server = None
+        sent_on_connection = 0
+        last_used = 0.0
+        needs_check = False   # Set after a failed send; the session may be in a bad state
+        try:
+            while not stop.is_set():
+                try:
+                    email = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                try:
+                    if server is None or sent_on_connection >= SMTP_MESSAGES_PER_CONNECTION:
+                        self._close_smtp_connection(server)
+                        server = None
+                        server = self._connect_smtp(email_config)
+                        sent_on_connection = 0
+                    elif needs_check or time.monotonic() - last_used >= SMTP_IDLE_CHECK_SECONDS:
+                        server = self._ensure_smtp_connection(server, email_config)
+                    needs_check = False
+                    
+                    server = self._send_with_retry(email, server, email_config, company_info)
+                    last_used = time.monotonic()
+                    sent_on_connection += 1
+                    with lock:
                         email['sent'] = True
                         email['sent_at'] = datetime.now().isoformat()
-                        sent_count += 1
+                        sent_emails.append(email)
+                        row = self._history_row(email)
+                        try:
+                            self._write_history_row(history_db, row)
+                        except sqlite3.Error as e:
+                            log.error("Could not record sent email to %s: %s", row[2], e)
+                    # The history tree is Tk state; only the display is marshaled
+                    self.root.after(0, self._show_history_row, row)
+                    progress()
+                except smtplib.SMTPAuthenticationError as e:
+                    # Every other login would fail the same way; stop all workers
+                    log.error("SMTP login rejected, stopping batch: %s", e)
+                    stop.set()
+                except Exception as e:
+                    needs_check = True
+                    log.error("Error sending email to %s: %s", email['prospect'].get('Email', 'Unknown'), e)
+        finally:
+            self._close_smtp_connection(server)
+
+    def _send_with_retry(self, email_data, server, email_config, company_info):
+        """Send one email, backing off and reconnecting on transient SMTP errors"""
+        # A disconnect during send_message is not retried: the server may already
+        # have accepted DATA, and resending could deliver the email twice
+        for attempt in range(SMTP_MAX_RETRIES + 1):
+            try:
+                self._deliver_email(email_data, server, email_config, company_info)
+                return server
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code not in SMTP_TRANSIENT_CODES or attempt == SMTP_MAX_RETRIES:
+                    raise
             
-            self.update_history()
-            messagebox.showinfo("Complete", f"Sent {sent_count} out of {unsent_count} emails.")
+            time.sleep(2 ** attempt)
+            self._close_smtp_connection(server)
+            server = self._connect_smtp(email_config)
+        return server
+
+    def _connect_smtp(self, email_config):
+        """Open a session, retrying drops during connect and login; nothing has been sent yet"""
+        for attempt in range(SMTP_MAX_RETRIES + 1):
+            try:
+                return self._open_smtp_connection(email_config)
+            except smtplib.SMTPServerDisconnected:
+                if attempt == SMTP_MAX_RETRIES:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def _open_smtp_connection(self, email_config):
+        """Open and authenticate an SMTP session"""
+        server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
+        server.starttls()
+        server.login(email_config['from_email'], email_config['from_password'])
+        return server
+
+    def _ensure_smtp_connection(self, server, email_config):
+        """Return a live SMTP session, reconnecting if the server dropped it"""
+        try:
+            status, _ = server.noop()
+            if status == 250:
+                return server
+        except smtplib.SMTPServerDisconnected:
+            pass
+        
+        self._close_smtp_connection(server)
+        return self._connect_smtp(email_config)
+
+    def _close_smtp_connection(self, server):
+        """Close an SMTP session, ignoring errors from already-dropped connections"""
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+    def _deliver_email(self, email_data, server, email_config, company_info):
+        """Build and send one message over an open SMTP session"""
+        # Single-part plain text message; send_message serializes it once
+        msg = EmailMessage()
+        msg['From'] = f"{company_info['name']} <{email_config['from_email']}>"
+        msg['To'] = email_data['prospect']['Email']
+        msg['Subject'] = email_data['subject']
+        msg.set_content(email_data['body'])
+        
+        server.send_message(msg, from_addr=email_config['from_email'])
 
     def _send_email(self, email_data):
-        """Send a single email"""
+        """Send a single email over its own SMTP session"""
+        server = None
         try:
             email_config = self.config.get_email_config()
             company_info = self.config.get_company_info()
             
-            msg = MIMEMultipart()
-            msg['From'] = f"{company_info['name']} <{email_config['from_email']}>"
-            msg['To'] = email_data['prospect']['Email']
-            msg['Subject'] = email_data['subject']
-            
-            msg.attach(MIMEText(email_data['body'], 'plain'))
-            
-            server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'])
-            server.starttls()
-            server.login(email_config['from_email'], email_config['from_password'])
-            
-            text = msg.as_string()
-            server.sendmail(email_config['from_email'], email_data['prospect']['Email'], text)
-            server.quit()
+            server = self._connect_smtp(email_config)
+            self._deliver_email(email_data, server, email_config, company_info)
             
             return True
             
         except Exception as e:
-            print(f"Error sending email: {e}")
+            log.exception("Error sending email: %s", e)
             return False
+        finally:
+            self._close_smtp_connection(server)
 
     def load_config_values(self):
         """Load configuration values into UI"""
@@ -592,26 +973,61 @@ Generate the complete email with subject and body clearly separated.
         except Exception as e:
             messagebox.showerror("Connection Failed", f"Failed to connect: {str(e)}")
 
-    def update_history(self):
-        """Update the email history display"""
-        # Clear existing items
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        # Add sent emails
-        for email in self.generated_emails:
-            if email.get('sent', False):
-                values = (
-                    email.get('sent_at', email.get('generated_at', '')),
-                    email['prospect'].get('Company Name', ''),
-                    email['prospect'].get('Email', ''),
-                    email['subject'][:50] + '...' if len(email['subject']) > 50 else email['subject'],
-                    'Sent'
-                )
-                self.history_tree.insert('', 'end', values=values)
+    def load_history(self):
+        """Populate the history display from the history database"""
+        rows = self.db.execute(
+            'SELECT sent_at, company, email, subject, status FROM history ORDER BY sent_at DESC LIMIT ?',
+            (HISTORY_LOAD_LIMIT,)
+        )
+        for sent_at, company, email, subject, status in rows:
+            self.history_tree.insert('', 'end', values=(sent_at, company, email, self._short_subject(subject), status))
+
+    def was_already_sent(self, email):
+        """Check the history database for this recipient and subject"""
+        row = self.db.execute(
+            'SELECT 1 FROM history WHERE email = ? AND subject_hash = ?',
+            (email['prospect'].get('Email', ''), self._subject_hash(email['subject']))
+        ).fetchone()
+        return row is not None
+
+    def record_sent_email(self, email):
+        """Append a sent email to the history database and display"""
+        row = self._history_row(email)
+        self._write_history_row(self.db, row)
+        self._show_history_row(row)
+
+    def _history_row(self, email):
+        """History table row for a sent email"""
+        return (
+            email.get('sent_at', email.get('generated_at', '')),
+            email['prospect'].get('Company Name', ''),
+            email['prospect'].get('Email', ''),
+            email['subject'],
+            email['body'],
+            'Sent',
+            self._subject_hash(email['subject'])
+        )
+
+    def _write_history_row(self, db, row):
+        """Insert and commit one history row; the unique index makes repeats no-ops"""
+        db.execute('INSERT OR IGNORE INTO history VALUES (?, ?, ?, ?, ?, ?, ?)', row)
+        db.commit()
+
+    def _show_history_row(self, row):
+        """Add a history row to the top of the history tree"""
+        sent_at, company, address, subject, _, status, _ = row
+        self.history_tree.insert('', 0, values=(sent_at, company, address, self._short_subject(subject), status))
+
+    def _subject_hash(self, subject):
+        """Short stable digest of a subject line for the idempotency key"""
+        return hashlib.blake2b(subject.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _short_subject(self, subject):
+        """Truncate a subject for the history display"""
+        return subject[:50] + '...' if len(subject) > 50 else subject
 
     def export_history(self):
-        """Export email history to CSV"""
+        """Export email history to CSV or Parquet"""
         sent_emails = [email for email in self.generated_emails if email.get('sent', False)]
         
         if not sent_emails:
@@ -621,42 +1037,75 @@ Generate the complete email with subject and body clearly separated.
         file_path = filedialog.asksaveasfilename(
             title="Export Email History",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv")]
+            filetypes=[("CSV files", "*.csv"), ("Parquet files", "*.parquet")]
         )
         
         if file_path:
-            try:
-                export_data = []
-                for email in sent_emails:
-                    export_data.append({
-                        'Sent Date': email.get('sent_at', ''),
-                        'Company Name': email['prospect'].get('Company Name', ''),
-                        'Contact Email': email['prospect'].get('Email', ''),
-                        'Industry': email['prospect'].get('Industry', ''),
-                        'Subject': email['subject'],
-                        'Body': email['body']
-                    })
-                
-                df = pd.DataFrame(export_data)
-                df.to_csv(file_path, index=False)
-                messagebox.showinfo("Success", f"History exported to {file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export: {str(e)}")
+            # Write in background thread to prevent GUI freezing
+            self.export_btn.config(state=tk.DISABLED)
+            thread = threading.Thread(target=self._export_history_thread, args=(sent_emails, file_path))
+            thread.daemon = True
+            thread.start()
+
+    def _export_history_thread(self, sent_emails, file_path):
+        """Write exported history in separate thread"""
+        try:
+            export_data = []
+            for email in sent_emails:
+                export_data.append({
+                    'Sent Date': email.get('sent_at', ''),
+                    'Company Name': email['prospect'].get('Company Name', ''),
+                    'Contact Email': email['prospect'].get('Email', ''),
+                    'Industry': email['prospect'].get('Industry', ''),
+                    'Subject': email['subject'],
+                    'Body': email['body']
+                })
+            
+            df = pd.DataFrame(export_data)
+            if file_path.lower().endswith('.parquet'):
+                df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+            else:
+                df.to_csv(file_path, index=False, chunksize=EXPORT_CHUNK_ROWS)
+            self.root.after(0, lambda: messagebox.showinfo("Success", f"History exported to {file_path}"))
+        except Exception as e:
+            log.exception("Failed to export history to %s", file_path)
+            self.root.after(0, lambda error=str(e): messagebox.showerror("Error", f"Failed to export: {error}"))
+        finally:
+            self.root.after(0, lambda: self.export_btn.config(state=tk.NORMAL))
 
     def clear_history(self):
         """Clear email history"""
         if messagebox.askyesno("Confirm Clear", "Clear all email history?"):
             self.generated_emails = []
-            self.update_history()
+            self.db.execute('DELETE FROM history')
+            self.db.commit()
+            self.history_tree.delete(*self.history_tree.get_children())
             self.email_counter.config(text="No emails generated")
             self.subject_entry.delete(0, tk.END)
             self.email_text.delete(1.0, tk.END)
 
+def setup_logging():
+    """Route log records through a queue to a rotating file so workers never block on I/O"""
+    file_handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(threadName)s: %(message)s'))
+    
+    log_queue = queue.Queue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
+
 def main():
     """Main application entry point"""
-    root = tk.Tk()
-    app = EmailGeneratorGUI(root)
-    root.mainloop()
+    listener = setup_logging()
+    try:
+        root = tk.Tk()
+        app = EmailGeneratorGUI(root)
+        root.mainloop()
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,17 +1,182 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
 import requests
-import smtplib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sys
 import threading
 import queue
+import json
+import functools
+import statistics
+from collections import deque
+from itertools import islice
+import shelve
+import hashlib
+import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED, TimeoutError, CancelledError
+from dataclasses import dataclass
 from datetime import datetime
 from yaml_config_manager import YAMLConfigManager
 
+# SMTP connection reuse
+SMTP_MAX_SENDS_PER_CONNECTION = 1000   # Rotate long-lived sessions
+SMTP_TRANSIENT_CODES = (421, 450, 451, 452)
+SMTP_MAX_RETRIES = 3
+SMTP_IDLE_CHECK_SECONDS = 30   # NOOP a kept session only after this long unused
+SMTP_IDLE_CLOSE_SECONDS = 300  # Send Current's sender logs out after this long without a send
+SMTP_SEND_DELAY = 1   # Seconds between batch sends; set email.send_delay: 0 to opt out
+SMTP_WORKERS = 1      # Concurrent SMTP sessions for batch sends; opt in to more with email.smtp_workers
+
+# Generation method labels for the editor header and results tree
+METHOD_ICONS = {"ai_fast": "🤖⚡", "ai_slow": "🤖🐌", "ai_reused": "♻️", "fallback": "📝", "failed": "❌"}
+METHOD_DISPLAY = {
+    "ai_fast": "🤖⚡ AI Fast",
+    "ai_slow": "🤖🐌 AI Slow",
+    "ai_reused": "♻️ AI Reused",
+    "fallback": "📝 Smart Template",
+    "failed": "❌ Failed"
+}
+
+# Minimum seconds between progress events from background workers
+PROGRESS_MIN_INTERVAL = 0.1
+
+# UI event polling: drain up to UI_EVENTS_PER_TICK per tick, slower when idle
+UI_POLL_ACTIVE_MS = 50
+UI_POLL_IDLE_MS = 500
+UI_EVENTS_PER_TICK = 64
+UI_COALESCED_EVENTS = frozenset(["progress", "status"])
+
+# Labelled lines in an AI response ("OPEN: ...", "BENEFIT: ...", "ACTION: ...")
+AI_LINE_RE = re.compile(r'^[ \t]*(OPEN|BENEFIT|ACTION):(.*)$', re.MULTILINE)
+AI_LABELS = frozenset(['OPEN', 'BENEFIT', 'ACTION'])
+
+# Keywords for sorting unlabelled AI lines; matched at word starts so "cleaning" hits "clean"
+AI_OPEN_WORDS = frozenset(['hope', 'hello', 'greetings', 'hi', 'good', 'team'])
+AI_BENEFIT_WORDS = frozenset(['clean', 'professional', 'productivity', 'maintain', 'environment', 'image', 'standards'])
+AI_ACTION_WORDS = frozenset(['call', 'meeting', 'schedule', 'discuss', 'available', 'talk', 'contact'])
+AI_OPEN_RE, AI_BENEFIT_RE, AI_ACTION_RE = (
+    re.compile(r'\b(?:' + '|'.join(sorted(words)) + ')')
+    for words in (AI_OPEN_WORDS, AI_BENEFIT_WORDS, AI_ACTION_WORDS)
+)
+
+# Leading/trailing colons and whitespace around a benefit line
+BENEFIT_EDGE_RE = re.compile(r'^[:\s]+|[:\s]+$')
+
+# Section labels the AI sometimes leaves in its output
+AI_LABEL_RE = re.compile(r'OPEN:|BENEFIT:|ACTION:|open:|benefit:|action:')
+
+# Quotes and stray punctuation the AI wraps around its lines
+AI_STRIP_CHARS = ' "\'.,!?-*'
+
+# Endings that already close a sentence
+SENTENCE_END = ('.', '!', '?')
+
+# A finished ACTION line in a streamed response means the rest can be skipped
+AI_ACTION_DONE_RE = re.compile(r'ACTION:[^\n]*\S[^\n]*\n')
+
+# Header spellings (lowercased, single-spaced) accepted for each expected field
+COLUMN_ALIASES = {
+    **dict.fromkeys(["company name", "company", "business name", "business"], "Company Name"),
+    **dict.fromkeys(["category", "industry", "business category"], "Category"),
+    **dict.fromkeys(["city", "location", "town"], "City"),
+    **dict.fromkeys(["email", "e-mail", "email address", "contact email"], "Email"),
+    **dict.fromkeys(["website", "url", "web site", "website url"], "Website"),
+}
+
+PROSPECT_COLUMNS = frozenset(COLUMN_ALIASES) | {"industry key"}
+
+def is_prospect_column(column):
+    """usecols filter for prospect files: the expected fields, their aliases and Industry Key"""
+    return " ".join(str(column).lower().split()) in PROSPECT_COLUMNS
+
+# Cache of AI lines per prospect; bump the version when prompts or the entry layout change
+EMAIL_CACHE_FILE = ".email_cache"
+EMAIL_TEMPLATE_VERSION = "3"
+
+# Ollama decode limits: a three-line reply fits well inside AI_NUM_PREDICT tokens,
+# and the prompt plus reply inside AI_NUM_CTX (raise ollama.num_ctx for large batches)
+AI_NUM_PREDICT = 160
+AI_NUM_CTX = 1024
+# Rough prompt cost of a batch request: fixed instructions plus one list line per prospect
+AI_BATCH_PROMPT_TOKENS = 150
+AI_BATCH_TOKENS_PER_PROSPECT = 20
+AI_STOP_SEQUENCES = ["Example:", "OPEN: [opening line]"]
+
+# Stands in for the company name in AI lines shared between prospects
+COMPANY_SLOT = "\x1fcompany\x1f"
+
+# Seconds allowed to open a connection to Ollama (reads use the fast/slow timeouts)
+AI_CONNECT_TIMEOUT = 3.05
+
+# Recent AI timings needed before the fast attempt may be skipped
+AI_SLOW_MIN_SAMPLES = 8
+
+# Seconds before the config tab's AI status is re-checked
+AI_STATUS_TTL = 30
+
+# Prospects preview: files above the limit are shown a page at a time
+PREVIEW_FULL_LIMIT = 500
+PREVIEW_PAGE_SIZE = 200
+SHOW_MORE_ITEM = "show_more"
+
+# Category keywords per industry_data key, checked in order (first match wins)
+INDUSTRY_KEYWORDS = [
+    ('education', ['education', 'preschool', 'school', 'academy', 'college', 'university', 'campus', 'steam']),
+    ('construction', ['construction', 'building', 'contractor', 'builder', 'plumbing', 'hvac', 'realty']),
+    ('technology', ['technology', 'tech', 'software', 'it', 'startup', 'computer']),
+    ('manufacturing', ['manufacturing', 'industrial', 'factory', 'plant']),
+    ('residential', ['residential', 'home', 'house', 'apartment', 'family']),
+    ('professional_services', ['office', 'professional services', 'consulting', 'consultant']),
+    ('food_beverage', ['food', 'beverage', 'restaurant', 'cafe', 'coffee', 'roaster']),
+    ('retail', ['retail', 'store', 'shop', 'market']),
+]
+
+# keyword -> (priority, industry key), so one regex scan can honour list order
+INDUSTRY_KEYWORD_RANK = {}
+for _rank, (_industry_key, _keywords) in enumerate(INDUSTRY_KEYWORDS):
+    for _keyword in _keywords:
+        INDUSTRY_KEYWORD_RANK.setdefault(_keyword, (_rank, _industry_key))
+INDUSTRY_KEYWORD_RE = re.compile('|'.join(map(re.escape, sorted(INDUSTRY_KEYWORD_RANK, key=len, reverse=True))))
+
+def summarize_generation_times(times):
+    """Mean and 95th percentile of per-email generation times (seconds)"""
+    if not times:
+        return 0.0, 0.0
+    if len(times) == 1:
+        return times[0], times[0]
+    # Inclusive method interpolates between samples, like a linear percentile
+    return statistics.mean(times), statistics.quantiles(times, n=20, method="inclusive")[18]
+
+@dataclass(slots=True)
+class ProspectRec:
+    """One prospect row, normalized once when generation starts"""
+    company: str
+    category: str       # Lowercased
+    city: str
+    email: str
+    website: str
+    industry_key: str
+
+
+@functools.lru_cache(maxsize=256)
+def clean_benefit(benefit):
+    """Trim edge colons/whitespace, capitalize and end with a period (memoized; fallbacks repeat)"""
+    benefit = BENEFIT_EDGE_RE.sub('', benefit)
+    if benefit and not benefit[0].isupper():
+        benefit = benefit[0].upper() + benefit[1:]
+    if benefit and not benefit.endswith('.'):
+        benefit += '.'
+    return benefit
+
+
+def clean_ai_line(text):
+    """Drop leftover labels and wrapping punctuation from an AI line and capitalize it"""
+    text = AI_LABEL_RE.sub('', text).strip().strip(AI_STRIP_CHARS)
+    return text[:1].upper() + text[1:]
+
+
 class HybridEmailGenerator:
     def __init__(self, root):
         self.root = root
@@ -21,30 +186,82 @@ class HybridEmailGenerator:
 
         # Configuration
         self.config = self._load_config()
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
         
         # AI settings optimized for slow Ollama
         self.ai_timeout_fast = 20   # Generous for fast models
         self.ai_timeout_slow = 45   # Retry timeout
-        self.max_workers = 1        # Keep sequential
+        self.max_workers = self.config.get('ollama', 'max_workers') or 4   # Concurrent Ollama requests
+        self.batch_size = self._clamp_batch_size(self.config.get('ollama', 'batch_size') or 1)   # Prospects per Ollama request
+        self.ollama_parallel = self.config.get('ollama', 'parallel')      # Server's OLLAMA_NUM_PARALLEL, if known
+        self.reuse_ai_lines = bool(self.config.get('ollama', 'reuse_lines'))   # Opt-in: share lines per category+city
+        self.session = self._create_session()
+        self._thread_local = threading.local()   # Per-worker sessions for generation threads
         self.debug_mode = True      # Always debug until working
         print(f"🤖 AI configured: Fast={self.ai_timeout_fast}s, Slow={self.ai_timeout_slow}s")
 
         
         # Application state
-        self.prospects = []
+        self.prospects = None   # Columnar DataFrame once loaded; see _iter_prospects
         self.emails = []
         self.current_idx = 0
         self.is_generating = False
         self.cancel_event = threading.Event()
         self.result_queue = queue.Queue()
+        self._ai_status_cache = (0.0, "⏳ Checking...")   # (timestamp, status) from _probe_ai
+        self._ai_probe_running = False
+        
+        # Cached SMTP session, reused across sends
+        self._from_header = f"{self.config.get('company', 'name')} <{self.config.get('email', 'from_email')}>"
+        self._smtp_local = threading.local()   # Per-thread SMTP session and send count
+        self._smtp_sessions = set()            # Every open session, so all can be closed together
+        self._smtp_lock = threading.Lock()
+        self._send_slot_lock = threading.Lock()
+        self._next_send_at = 0.0
+        self._send_current_queue = queue.Queue()   # (index, email) for the Send Current thread; None stops it
+        self._send_current_thread = None
+        
+        # On-disk cache of AI-generated emails, shared by generation workers
+        self._cache = shelve.open(EMAIL_CACHE_FILE, writeback=False)
+        self._cache_closed = False
+        self._cache_lock = threading.Lock()
+        self._generation_locks = {}   # cache key -> lock, so duplicate prospects call Ollama once
+        
+        # AI lines per (category, city) with the company name slotted out, reused this run
+        self._shared_lines = {}
+        self._shared_lines_lock = threading.Lock()
+        
+        # Recent Ollama call times, used to skip the fast attempt on a slow server
+        self._recent_ai_times = deque(maxlen=16)
+        self._ai_times_lock = threading.Lock()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Industry-specific boilerplates for AI customization
         self.industry_data = self._load_industry_data()
+        self._fallback_templates = self._compile_fallback_templates()
+        self._body_templates = self._compile_body_templates()
+        self._prompt_templates = self._compile_prompt_templates()
+        # Normalized category -> industry_data key for exact keyword hits
+        self._industry_alias = {key: key for key in self.industry_data}
+        for industry_key, keywords in reversed(INDUSTRY_KEYWORDS):   # Earlier entries win
+            self._industry_alias.update(dict.fromkeys(keywords, industry_key))
+        
+        # UI event dispatch for result_queue messages
+        self._event_handlers = {
+            "progress": self._on_progress,
+            "generation_complete": self._on_generation_complete,
+            "status": self._on_status,
+            "ai_status": self._on_ai_status,
+            "prospects_loaded": self._on_prospects_loaded,
+            "load_error": self._on_load_error,
+            "send_complete": self._on_send_complete,
+            "send_current_complete": self._on_send_current_complete,
+        }
         
         self._build_ui()
         self._start_ui_updater()
+        
+        # Start loading the model while the user picks a file
+        threading.Thread(target=self._preload_model, daemon=True).start()
     
     def _parse_ai_response(self, ai_text):
         """Parse AI response and clean labels"""
@@ -53,15 +270,11 @@ class HybridEmailGenerator:
         
         opening = benefit = action = ""
         
-        # Method 1: Try exact format first (OPEN:, BENEFIT:, ACTION:)
-        for line in ai_text.split('\n'):
-            line = line.strip()
-            if line.startswith('OPEN:'):
-                opening = line[5:].strip()  # Remove "OPEN:" label
-            elif line.startswith('BENEFIT:'):
-                benefit = line[7:].strip()  # Remove "BENEFIT:" label
-            elif line.startswith('ACTION:'):
-                action = line[7:].strip()   # Remove "ACTION:" label
+        # Method 1: Try exact format first (OPEN:, BENEFIT:, ACTION:), one regex scan
+        labelled = {label: text.strip() for label, text in AI_LINE_RE.findall(ai_text)}
+        opening = labelled.get('OPEN', "")
+        benefit = labelled.get('BENEFIT', "")
+        action = labelled.get('ACTION', "")
         
         # Method 2: If exact format failed, try flexible extraction
         if not all([opening, benefit, action]):
@@ -69,7 +282,7 @@ class HybridEmailGenerator:
                 print(f"   🔄 Trying flexible extraction...")
             
             # Split into lines and clean up
-            lines = [line.strip() for line in ai_text.split('\n') if line.strip() and len(line.strip()) > 5]
+            lines = [line for line in map(str.strip, ai_text.splitlines()) if len(line) > 5]
             
             # Remove any numbered lines (1., 2., 3.) and labels
             clean_lines = []
@@ -77,10 +290,10 @@ class HybridEmailGenerator:
                 # Remove leading numbers, bullets, and labels
                 line = line.strip('123456789.- ')
                 
-                # Remove any remaining labels that might be embedded
-                for label in ['OPEN:', 'BENEFIT:', 'ACTION:']:
-                    if line.startswith(label):
-                        line = line[len(label):].strip()
+                # Remove a leading label with one partition instead of a startswith per label
+                label, sep, rest = line.partition(':')
+                if sep and label in AI_LABELS:
+                    line = rest.strip()
                 
                 if line and len(line) > 5:
                     clean_lines.append(line)
@@ -90,17 +303,17 @@ class HybridEmailGenerator:
                 lower_line = line.lower()
                 
                 # Opening: contains greetings, company name, or hope/hello
-                if not opening and any(word in lower_line for word in ['hope', 'hello', 'greetings', 'hi', 'good', 'team']):
+                if not opening and AI_OPEN_RE.search(lower_line):
                     opening = line
                     continue
                 
                 # Benefit: contains cleaning/business benefits
-                if not benefit and any(word in lower_line for word in ['clean', 'professional', 'productivity', 'maintain', 'environment', 'image', 'standards']):
+                if not benefit and AI_BENEFIT_RE.search(lower_line):
                     benefit = line
                     continue
                 
                 # Action: contains meeting/call requests
-                if not action and any(word in lower_line for word in ['call', 'meeting', 'schedule', 'discuss', 'available', 'talk', 'contact']):
+                if not action and AI_ACTION_RE.search(lower_line):
                     action = line
                     continue
             
@@ -122,30 +335,16 @@ class HybridEmailGenerator:
             action = "Could we schedule a brief call to discuss your cleaning needs"
         
         # CRITICAL: Clean up any remaining labels and formatting
-        def clean_text(text):
-            # Remove any remaining labels
-            for label in ['OPEN:', 'BENEFIT:', 'ACTION:', 'open:', 'benefit:', 'action:']:
-                text = text.replace(label, '').strip()
-            
-            # Remove extra quotes, formatting
-            text = text.strip(' "\'.,!?-*')
-            
-            # Ensure proper capitalization
-            if text and not text[0].isupper():
-                text = text[0].upper() + text[1:]
-            
-            return text
-        
-        opening = clean_text(opening)
-        benefit = clean_text(benefit)
-        action = clean_text(action)
+        opening = clean_ai_line(opening)
+        benefit = clean_ai_line(benefit)
+        action = clean_ai_line(action)
         
         # Ensure proper punctuation
-        if opening and not opening.endswith(('.', '!', '?')):
+        if opening and not opening.endswith(SENTENCE_END):
             opening += '.'
-        if benefit and not benefit.endswith(('.', '!', '?')):
+        if benefit and not benefit.endswith(SENTENCE_END):
             benefit += '.'
-        if action and not action.endswith(('.', '!', '?')):
+        if action and not action.endswith(SENTENCE_END):
             action += '?'
         
         if hasattr(self, 'debug_mode') and self.debug_mode:
@@ -162,33 +361,16 @@ class HybridEmailGenerator:
         except Exception as e:
             messagebox.showerror("Config Error", f"Error loading config: {e}")
             raise
-    def _warmup_model_if_needed(self):
-        """Quick model warmup to avoid slow first request"""
+    def _preload_model(self):
+        """Ask Ollama to load the model (a request with no prompt only loads it and sets keep_alive)"""
         try:
-            ollama_config = self.config.get("ollama")
-            warmup_payload = {
-                "model": ollama_config["model"], 
-                "prompt": "ready",
-                "stream": False,
-                "options": {"num_predict": 1}
-            }
-            
-            response = self.session.post(
-                ollama_config["url"],
-                json=warmup_payload, 
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                print("🔥 Model warmed up and ready")
-                return True
-            else:
-                print("⚠️ Model may be cold - first generation will be slower")
-                return False
-        except:
-            print("⚠️ Warmup failed - first generation may be slower")
-            return False
-
+            response = self._worker_session().post(self.config.get("ollama", "url"),
+                                                   json={**self._base_payload(), "stream": False},
+                                                   timeout=(AI_CONNECT_TIMEOUT, 120))
+            response.raise_for_status()
+            print("🔥 Model loaded in the background")
+        except Exception as e:
+            print(f"⚠️ Background model load failed: {e}")
 
     def _load_industry_data(self):
         """Industry-specific data for AI customization and fallbacks"""
@@ -275,6 +457,19 @@ class HybridEmailGenerator:
             }
         }
 
+    def _compile_fallback_templates(self):
+        """Split each fallback template around {company_name} once, so rendering is a concat"""
+        return {
+            (industry_key, field): info[field].partition("{company_name}")
+            for industry_key, info in self.industry_data.items()
+            for field in ('fallback_opening', 'fallback_benefit', 'fallback_action')
+        }
+
+    def _render_fallback(self, industry_key, field, company_name):
+        """Render a fallback template for one prospect"""
+        prefix, placeholder, suffix = self._fallback_templates[(industry_key, field)]
+        return f"{prefix}{company_name}{suffix}" if placeholder else prefix
+
     def _build_ui(self):
         # Menu
         self._create_menu()
@@ -302,7 +497,7 @@ class HybridEmailGenerator:
         file_menu.add_command(label="Load CSV/Excel", command=self._load_csv)
         file_menu.add_command(label="Create Test CSV", command=self._create_test_csv)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
 
     def _create_generation_tab(self):
         self.gen_tab = ttk.Frame(self.notebook)
@@ -341,6 +536,8 @@ class HybridEmailGenerator:
         
         scrollbar1 = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.prospects_tree.yview)
         self.prospects_tree.configure(yscrollcommand=scrollbar1.set)
+        self.prospects_tree.bind("<Double-1>", self._on_prospects_tree_double_click)
+        self.prospects_shown = 0
         self.prospects_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar1.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -391,7 +588,10 @@ class HybridEmailGenerator:
         editor_frame.pack(fill=tk.BOTH, expand=True)
         
         ttk.Label(editor_frame, text="Subject:").pack(anchor="w")
-        self.subject_entry = ttk.Entry(editor_frame, font=("Arial", 10))
+        self.subject_var = tk.StringVar()
+        self._subject_modified = False
+        self.subject_var.trace_add("write", self._on_subject_modified)
+        self.subject_entry = ttk.Entry(editor_frame, textvariable=self.subject_var, font=("Arial", 10))
         self.subject_entry.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(editor_frame, text="Email Body:").pack(anchor="w")
@@ -402,61 +602,111 @@ class HybridEmailGenerator:
         self.config_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.config_tab, text="⚙️ Configuration")
         
+        # Concurrency control (Ollama requests are I/O bound, so threads scale)
+        workers_frame = ttk.Frame(self.config_tab)
+        workers_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        ttk.Label(workers_frame, text="Max AI Workers:").pack(side=tk.LEFT)
+        self.max_workers_var = tk.IntVar(value=self.max_workers)
+        self.max_workers_var.trace_add("write", lambda *_: self._update_max_workers())
+        ttk.Spinbox(workers_frame, from_=1, to=16, width=5,
+                    textvariable=self.max_workers_var).pack(side=tk.LEFT, padx=(10, 0))
+        
         config_frame = ttk.LabelFrame(self.config_tab, text="Hybrid AI Configuration", padding=10)
         config_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        config_text = scrolledtext.ScrolledText(config_frame, height=25, wrap=tk.WORD)
-        config_text.pack(fill=tk.BOTH, expand=True)
+        self.config_text = scrolledtext.ScrolledText(config_frame, height=25, wrap=tk.WORD)
+        self.config_text.pack(fill=tk.BOTH, expand=True)
         
-        # Test AI and show config
+        self._render_config_info()
+
+    def _render_config_info(self):
+        """Fill the config tab text using the cached AI status"""
         ai_status = self._test_ai_connection()
         
-        config_info = f"""📧 Email Configuration:
-Email: {self.config.get('email', 'from_email')}
-Status: {'✅ Ready' if self.config.is_email_configured() else '❌ Configure in config.yaml'}
-
-🏢 Company Information:
-Name: {self.config.get('company', 'name')}
-Website: {self.config.get('company', 'website')}
-Phone: {self.config.get('company', 'phone')}
-
-🤖 AI Configuration:
-Model: {self.config.get('ollama', 'model')}
-URL: {self.config.get('ollama', 'url')}
-Status: {ai_status}
-
-⚡ Hybrid Generation Settings:
-• Fast AI Timeout: {self.ai_timeout_fast}s (quick attempt)
-• Slow AI Timeout: {self.ai_timeout_slow}s (retry)
-• Max Workers: {self.max_workers} (prevents overwhelming slow AI)
-• Fallback: Smart industry-specific templates
-
-📊 Expected Excel/CSV Fields:
-• Company Name (required)
-• Category (required - business category/industry)
-• City (required - business location)
-• Email (required - contact email)
-• Website (optional - company website)
-
-🏠 Supported Categories:
-• Education, Construction, Technology, Manufacturing
-• Residential, Office, Professional Services
-• Food & Beverage, Retail, and more
-• Auto-detected from category field
-
-🔄 How Hybrid Mode Works:
-1. Try AI generation with {self.ai_timeout_fast}s timeout
-2. If AI times out → Use smart template fallback
-3. If AI fails → Retry once with {self.ai_timeout_slow}s timeout
-4. If still fails → Use template with category customization
-
-💡 This ensures you always get emails, even if AI is slow!
-
-Overall Status: {self.config.get_config_status()}
-"""
-        
-        config_text.insert(1.0, config_info)
-        config_text.config(state=tk.DISABLED)
+        # Fetch each section once instead of walking the config per field
+        email_cfg = self.config.get_email_config()
+        company = self.config.get_company_info()
+        ollama = self.config.get_ollama_config()
+        
+        config_info = "\n".join([
+            "📧 Email Configuration:",
+            f"Email: {email_cfg.get('from_email')}",
+            f"Status: {'✅ Ready' if self.config.is_email_configured() else '❌ Configure in config.yaml'}",
+            "",
+            "🏢 Company Information:",
+            f"Name: {company.get('name')}",
+            f"Website: {company.get('website')}",
+            f"Phone: {company.get('phone')}",
+            "",
+            "🤖 AI Configuration:",
+            f"Model: {ollama.get('model')}",
+            f"URL: {ollama.get('url')}",
+            f"Status: {ai_status}",
+            "",
+            "⚡ Hybrid Generation Settings:",
+            f"• Fast AI Timeout: {self.ai_timeout_fast}s (quick attempt)",
+            f"• Slow AI Timeout: {self.ai_timeout_slow}s (retry)",
+            f"• Max Workers: {self.max_workers} (concurrent AI requests, set ollama.max_workers)",
+            f"• Server Parallel: {self.ollama_parallel or 'not set'} (caps workers, set ollama.parallel)",
+            f"• Reuse AI Lines: {'on' if self.reuse_ai_lines else 'off'} (same category + city, set ollama.reuse_lines)",
+            "• Fallback: Smart industry-specific templates",
+            "",
+            "📊 Expected Excel/CSV Fields:",
+            "• Company Name (required)",
+            "• Category (required - business category/industry)",
+            "• City (required - business location)",
+            "• Email (required - contact email)",
+            "• Website (optional - company website)",
+            "",
+            "🏠 Supported Categories:",
+            "• Education, Construction, Technology, Manufacturing",
+            "• Residential, Office, Professional Services",
+            "• Food & Beverage, Retail, and more",
+            "• Auto-detected from category field",
+            "",
+            "🔄 How Hybrid Mode Works:",
+            f"1. Try AI generation with {self.ai_timeout_fast}s timeout",
+            "2. If AI times out → Use smart template fallback",
+            f"3. If AI fails → Retry once with {self.ai_timeout_slow}s timeout",
+            "4. If still fails → Use template with category customization",
+            "",
+            "💡 This ensures you always get emails, even if AI is slow!",
+            "",
+            f"Overall Status: {self.config.get_config_status()}",
+            "",
+        ])
+        
+        self.config_text.config(state=tk.NORMAL)
+        self.config_text.delete(1.0, tk.END)
+        self.config_text.insert(1.0, config_info)
+        self.config_text.config(state=tk.DISABLED)
+
+    def _update_max_workers(self):
+        """Apply the worker count chosen in the config tab"""
+        try:
+            self.max_workers = max(1, int(self.max_workers_var.get()))
+        except (tk.TclError, ValueError):
+            pass  # Partially typed value; keep the previous setting
+
+    def _create_session(self):
+        """Create a keep-alive HTTP session for Ollama requests, pooled to the worker count"""
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=["POST", "GET"])
+        pool_size = self.max_workers * 2
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _worker_session(self):
+        """Return the calling thread's own HTTP session"""
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
+        return session
 
     def _create_results_tab(self):
         self.results_tab = ttk.Frame(self.notebook)
@@ -482,37 +732,68 @@ Overall Status: {self.config.get_config_status()}
 
     def _process_ui_events(self):
         """Process events from background threads"""
+        events = []
         try:
-            while True:
-                event = self.result_queue.get_nowait()
-                self._handle_ui_event(event)
+            while len(events) < UI_EVENTS_PER_TICK:
+                events.append(self.result_queue.get_nowait())
         except queue.Empty:
             pass
         
-        self.root.after(100, self._process_ui_events)  # Update every 100ms
-
-    def _handle_ui_event(self, event):
-        """Handle UI events from background threads"""
-        event_type = event.get("type")
-        
-        if event_type == "progress":
-            current, total = event["current"], event["total"]
-            self.progress.config(maximum=total, value=current)
-            self.progress_label.config(text=f"{current}/{total}")
-            if "message" in event:
-                self.status_bar.config(text=event["message"])
-        
-        elif event_type == "generation_complete":
-            self._handle_generation_complete(event["results"])
+        # Progress and status only show their latest value, so skip superseded ones this tick
+        latest = {event.get("type"): i for i, event in enumerate(events)
+                  if event.get("type") in UI_COALESCED_EVENTS}
+        for i, event in enumerate(events):
+            event_type = event.get("type")
+            if event_type in UI_COALESCED_EVENTS and latest[event_type] != i:
+                continue
+            handler = self._event_handlers.get(event_type)
+            if handler:
+                handler(event)
         
-        elif event_type == "status":
+        # Poll fast while events are flowing, back off when idle
+        delay = UI_POLL_ACTIVE_MS if events else UI_POLL_IDLE_MS
+        self.root.after(delay, self._process_ui_events)
+
+    def _on_progress(self, event):
+        """Update the progress bar and label"""
+        current, total = event["current"], event["total"]
+        self.progress.config(maximum=total, value=current)
+        self.progress_label.config(text=f"{current}/{total}")
+        if "message" in event:
             self.status_bar.config(text=event["message"])
 
+    def _on_generation_complete(self, event):
+        """Hand finished results to the completion handler"""
+        self._handle_generation_complete(event["results"])
+
+    def _on_status(self, event):
+        """Show a status bar message"""
+        self.status_bar.config(text=event["message"])
+
+    def _on_ai_status(self, event):
+        """Re-render the config tab with the new AI status"""
+        self._render_config_info()
+
     def _test_ai_connection(self):
+        """Return the cached AI status, refreshing it in the background when stale"""
+        checked_at, status = self._ai_status_cache
+        if time.time() - checked_at >= AI_STATUS_TTL and not self._ai_probe_running:
+            self._ai_probe_running = True
+            threading.Thread(target=self._probe_ai, daemon=True).start()
+        return status
+
+    def _probe_ai(self):
+        """Check the Ollama server off the Tk thread and post the result"""
+        status = self._check_ai_connection()
+        self._ai_status_cache = (time.time(), status)
+        self._ai_probe_running = False
+        self.result_queue.put({"type": "ai_status", "message": status})
+
+    def _check_ai_connection(self):
         """Test AI connection with proper timeout handling"""
         try:
             tags_url = self.config.get('ollama', 'url').replace('/api/generate', '/api/tags')
-            response = requests.get(tags_url, timeout=3)
+            response = self.session.get(tags_url, timeout=(AI_CONNECT_TIMEOUT, 3))
             if response.status_code == 200:
                 return "✅ Connected (fast)"
             else:
@@ -536,23 +817,37 @@ Overall Status: {self.config.get_config_status()}
         if not file_path:
             return
         
+        # Parse off the Tk thread; results come back through result_queue
+        self.file_status.config(text="⏳ Loading prospects...", foreground="black")
+        threading.Thread(target=self._load_csv_worker, args=(file_path,), daemon=True).start()
+
+    def _load_csv_worker(self, file_path):
+        """Read and clean a prospects file in the background"""
+        # Imported here rather than at startup; pandas is slow to import and only needed once a file loads
+        import pandas as pd
+        
         try:
-            # Load file based on extension
+            # Load file based on extension; everything is text, and only known columns are parsed
+            read_options = {"dtype": str, "keep_default_na": False, "na_filter": False,
+                            "usecols": is_prospect_column}
             if file_path.lower().endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, **read_options)
             else:
-                df = pd.read_csv(file_path)
+                df = pd.read_csv(file_path, engine="c", **read_options)
+            
+            df = self._normalize_columns(df)
             
             # Validate required fields
             required_fields = ["Company Name", "Category", "City", "Email"]
             missing_fields = [field for field in required_fields if field not in df.columns]
             
             if missing_fields:
-                messagebox.showerror(
-                    "Missing Required Fields", 
-                    f"Your file is missing these required columns:\n{', '.join(missing_fields)}\n\n"
-                    f"Expected columns: Company Name, Category, City, Email, Website (optional)"
-                )
+                self.result_queue.put({
+                    "type": "load_error",
+                    "title": "Missing Required Fields",
+                    "message": f"Your file is missing these required columns:\n{', '.join(missing_fields)}\n\n"
+                               f"Expected columns: Company Name, Category, City, Email, Website (optional)"
+                })
                 return
             
             # Handle optional Website field
@@ -560,37 +855,55 @@ Overall Status: {self.config.get_config_status()}
                 df["Website"] = ""
                 print("📝 Website column not found - added empty Website field")
             
-            # Clean and validate data
-            # Remove rows with empty company names
-            df = df[df["Company Name"].str.strip().astype(bool)]
+            # Clean and validate data with vectorized string ops (no NaN: na_filter=False)
+            for column in required_fields + ["Website"]:
+                df[column] = df[column].str.strip()
             
-            # Remove rows with empty emails
-            df = df[df["Email"].str.strip().astype(bool)]
+            # Remove rows with empty company names or emails in one mask
+            df = df[df["Company Name"].ne("") & df["Email"].ne("")].copy()
+            fields = ', '.join(df.columns)
             
-            # Fill NaN values
-            df = df.fillna("")
+            # Resolve industries, keeping any valid keys the file already carries
+            self._fill_industry_keys(df)
             
-            # Store as records
-            self.prospects = df.to_dict("records")
-            
-            # Success message
-            self.file_status.config(
-                text=f"✅ Loaded {len(self.prospects)} prospects\n📊 Fields: {', '.join(df.columns)}", 
-                foreground="green"
-            )
-            self._refresh_prospects_tree()
-            self.generate_btn.config(state=tk.NORMAL)
-            self.gen_status.config(text="Ready to generate hybrid emails")
-            
-            print(f"📂 Successfully loaded {len(self.prospects)} prospects from {file_path}")
+            print(f"📂 Successfully loaded {len(df)} prospects from {file_path}")
             print(f"📊 Columns found: {list(df.columns)}")
+            self.result_queue.put({"type": "prospects_loaded", "df": df, "fields": fields})
             
         except Exception as e:
-            messagebox.showerror("File Load Error", f"Failed to load file: {str(e)}")
             print(f"❌ Error loading file: {e}")
+            self.result_queue.put({
+                "type": "load_error",
+                "title": "File Load Error",
+                "message": f"Failed to load file: {str(e)}"
+            })
+
+    def _on_prospects_loaded(self, event):
+        """Install prospects parsed by _load_csv_worker"""
+        # Keep prospects columnar; rows become dicts only when generated
+        self.prospects = event["df"]
+        
+        # Success message
+        self.file_status.config(
+            text=f"✅ Loaded {len(self.prospects)} prospects\n📊 Fields: {event['fields']}", 
+            foreground="green"
+        )
+        self._refresh_prospects_tree()
+        self.generate_btn.config(state=tk.NORMAL)
+        self.gen_status.config(text="Ready to generate hybrid emails")
+
+    def _on_load_error(self, event):
+        """Report a failed prospects load"""
+        if not self._prospect_count():
+            self.file_status.config(text="No file loaded", foreground="gray")
+        else:
+            self.file_status.config(text=f"✅ Loaded {len(self.prospects)} prospects", foreground="green")
+        messagebox.showerror(event["title"], event["message"])
 
     def _create_test_csv(self):
         """Create test CSV with your exact field structure"""
+        import pandas as pd
+        
         test_data = {
             "Company Name": [
                 "A5 Star Plumbing Company",
@@ -639,7 +952,8 @@ Overall Status: {self.config.get_config_status()}
         df.to_csv(file_path, index=False)
         
         # Load the test data
-        self.prospects = df.to_dict("records")
+        df["Industry Key"] = self._map_categories_to_industries(df["Category"])
+        self.prospects = df
         self.file_status.config(
             text=f"✅ Created & loaded {len(self.prospects)} test prospects\n📊 Perfect field structure", 
             foreground="green"
@@ -656,62 +970,113 @@ Overall Status: {self.config.get_config_status()}
             "✅ Ready for email generation testing"
         )
 
+    def _normalize_columns(self, df):
+        """Rename known header aliases to the expected field names in one pass over the columns"""
+        renames = {}
+        present = set(df.columns)
+        for column in df.columns:
+            target = COLUMN_ALIASES.get(" ".join(str(column).lower().split()))
+            if target and target != column and target not in present:
+                renames[column] = target
+                present.add(target)
+        if renames:
+            print(f"📝 Renamed columns: {renames}")
+        return df.rename(columns=renames)
+
     def _refresh_prospects_tree(self):
         """Refresh the prospects tree view"""
-        for item in self.prospects_tree.get_children():
-            self.prospects_tree.delete(item)
-        
-        for prospect in self.prospects:
-            values = (
-                prospect.get("Company Name", "")[:30],
-                prospect.get("Category", "")[:20],
-                prospect.get("City", "")[:15],
-                prospect.get("Email", "")[:30],
-                prospect.get("Website", "")[:30]
-            )
-            self.prospects_tree.insert("", "end", values=values)
+        children = self.prospects_tree.get_children()
+        if children:
+            self.prospects_tree.delete(*children)
+        self.prospects_shown = 0
+        
+        if not self._prospect_count():
+            return
+        
+        # Large files start with one page; the rest load via the "show more" row
+        limit = len(self.prospects) if len(self.prospects) <= PREVIEW_FULL_LIMIT else PREVIEW_PAGE_SIZE
+        self._show_more_prospects(limit)
+
+    def _show_more_prospects(self, count):
+        """Append the next `count` prospects to the tree, plus a "show more" row if any remain"""
+        if self.prospects_tree.exists(SHOW_MORE_ITEM):
+            self.prospects_tree.delete(SHOW_MORE_ITEM)
+        
+        start, stop = self.prospects_shown, min(self.prospects_shown + count, len(self.prospects))
+        page = self.prospects.iloc[start:stop]
+        # Full strings go straight in; ttk clips them to the column width
+        rows = zip(*(page[column].tolist() for column in ("Company Name", "Category", "City", "Email", "Website")))
+        
+        # Hide columns while inserting so Tk doesn't re-layout per row
+        self.prospects_tree.configure(displaycolumns=())
+        try:
+            for values in rows:
+                self.prospects_tree.insert("", "end", values=values)
+        finally:
+            self.prospects_tree.configure(displaycolumns="#all")
+        self.prospects_shown = stop
+        
+        remaining = len(self.prospects) - stop
+        if remaining > 0:
+            self.prospects_tree.insert("", "end", iid=SHOW_MORE_ITEM,
+                                       values=(f"⬇ Show more ({remaining} remaining)", "", "", "", ""))
+
+    def _on_prospects_tree_double_click(self, event):
+        """Load the next page when the "show more" row is double-clicked"""
+        if self.prospects_tree.identify_row(event.y) == SHOW_MORE_ITEM:
+            self._show_more_prospects(PREVIEW_PAGE_SIZE)
+
+    def _prospect_count(self):
+        """Number of loaded prospects (0 before any file is loaded)"""
+        return 0 if self.prospects is None else len(self.prospects)
+
+    def _iter_prospects(self):
+        """Yield each prospect row as a ProspectRec, built only when needed"""
+        columns = ["Company Name", "Category", "City", "Email", "Website", "Industry Key"]
+        # Zip the column lists directly instead of copying a sub-frame for itertuples
+        column_lists = [self.prospects[column].tolist() for column in columns]
+        # Lowercase each distinct category once; prospects sharing it share one interned str
+        lowered = {category: sys.intern(category.lower()) for category in set(column_lists[1])}
+        for company, category, city, email, website, industry_key in zip(*column_lists):
+            category = lowered[category]
+            yield ProspectRec(company, category, city, email, website,
+                              industry_key or self._canon_industry(category))
     
     def _pre_warm_model(self):
         """Pre-warm model to ensure it stays loaded"""
         try:
             ollama_config = self.config.get("ollama")
             
-            # Send a warming request
+            # Warm with a real prompt for the most common industry, so Ollama's prefix cache
+            # already holds the fixed instructions when the first prospect arrives
+            industry_key = self.prospects["Industry Key"].value_counts().idxmax()
+            prompt = self._prompt_templates[industry_key].format(
+                company_name="WarmupCo", category="office", city="Baton Rouge", website_line=""
+            )
             payload = {
-                "model": ollama_config["model"],
-                "prompt": "Ready for email generation",
-                "stream": False,
-                "options": {
-                    "num_predict": 5,
-                    "temperature": 0.7
-                }
+                **self._base_payload(num_predict=16, temperature=0.7),
+                "prompt": prompt
             }
             
             print(f"🔥 Pre-warming {ollama_config['model']}...")
             start_time = time.time()
             
-            response = self.session.post(
-                ollama_config["url"],
-                json=payload,
-                timeout=60
-            )
+            self._ollama_generate_stream(payload, 60, session=self.session)
             
             duration = time.time() - start_time
-            
-            if response.status_code == 200:
-                print(f"✅ Model warmed in {duration:.1f}s - ready for {len(self.prospects)} emails")
-                return True
-            else:
-                print(f"❌ Warmup failed: {response.status_code}")
-                return False
+            print(f"✅ Model warmed in {duration:.1f}s - ready for {len(self.prospects)} emails")
+            return True
                 
+        except requests.exceptions.HTTPError as e:
+            print(f"❌ Warmup failed: {e.response.status_code}")
+            return False
         except Exception as e:
             print(f"❌ Warmup error: {e}")
             return False
       
     def _start_generation(self):
         """Start generation with model warmup"""
-        if not self.prospects:
+        if not self._prospect_count():
             messagebox.showwarning("No Data", "Please load a CSV/Excel file first.")
             return
         
@@ -730,10 +1095,12 @@ Overall Status: {self.config.get_config_status()}
             self.status_bar.config(text="⚠️ AI warmup failed - may use some templates...")
         
         self.root.update()
-        time.sleep(1)
         
         self.is_generating = True
         self.cancel_event.clear()
+        self._generation_locks = {}
+        self._shared_lines.clear()
+        self._recent_ai_times.clear()
         self.emails = []
         
         # Update UI
@@ -742,40 +1109,98 @@ Overall Status: {self.config.get_config_status()}
         self.progress.config(maximum=len(self.prospects), value=0)
         self.progress_label.config(text="0/0")
         
-        # Start background generation
-        thread = threading.Thread(target=self._generate_worker_sequential, daemon=True)
+        # Start background generation (concurrent unless limited to one worker)
+        worker = self._generate_worker if self._generation_workers() > 1 else self._generate_worker_sequential
+        thread = threading.Thread(target=worker, daemon=True)
         thread.start()
     
+    def _generation_workers(self):
+        """Concurrent AI requests to run; more than the server decodes at once just
+        queue there with their timeouts already running"""
+        if self.ollama_parallel:
+            return max(1, min(self.max_workers, self.ollama_parallel))
+        return self.max_workers
+
     def _generate_single_email_with_retry(self, index, prospect):
         """Generate single email with aggressive AI retry"""
+        cache_key = self._email_cache_key(prospect)
+        with self._cache_lock:
+            key_lock = self._generation_locks.setdefault(cache_key, threading.Lock())
+        
+        # Identical prospects generate once; the others wait here, then hit the cache
+        with key_lock:
+            return self._generate_or_reuse(index, prospect, cache_key)
+
+    def _generate_or_reuse(self, index, prospect, cache_key):
+        """Return the cached AI email for cache_key, or generate one with retries"""
         start_time = time.time()
-        company_name = prospect.get("Company Name", "Unknown")
+        company_name = prospect.company
+        
+        # Reuse a previous AI result for identical inputs
+        cached = self._cache_get(cache_key)
+        if cached:
+            print(f"   💾 Cached AI email for {company_name}")
+            return {
+                "original_index": index,
+                "prospect": prospect,
+                **self._compose_ai_email(prospect, cached["lines"]),
+                "method": cached["method"],
+                "generation_time": "0.0s",
+                "generation_seconds": 0.0,
+                "generated_at": datetime.now().isoformat(),
+                "sent": False
+            }
+        
+        # Same category and city as an earlier AI email: reuse its lines instead of asking again
+        lines = self._shared_ai_lines(prospect)
+        if lines:
+            print(f"   ♻️ Reusing AI lines for {company_name}")
+            return {
+                "original_index": index,
+                "prospect": prospect,
+                **self._compose_ai_email(prospect, lines),
+                "method": "ai_reused",
+                "generation_time": "0.0s",
+                "generation_seconds": 0.0,
+                "generated_at": datetime.now().isoformat(),
+                "sent": False
+            }
         
-        # Try AI with multiple attempts
-        for attempt in range(3):  # Up to 3 attempts per email
+        # Try AI with multiple attempts; skip the fast one once Ollama has proven slow
+        first_attempt = 1 if self._ollama_is_slow() else 0
+        for attempt in range(first_attempt, 3):  # Up to 3 attempts per email
+            if self.cancel_event.is_set():
+                raise CancelledError()
             try:
                 timeout = self.ai_timeout_fast if attempt == 0 else self.ai_timeout_slow
                 print(f"   🤖 AI attempt {attempt+1} (timeout: {timeout}s)")
                 
-                subject, body = self._try_ai_generation(prospect, timeout)
+                call_start = time.time()
+                lines = self._try_ai_generation(prospect, timeout)
+                self._record_ai_time(time.time() - call_start)
                 method = "ai_fast" if attempt == 0 else "ai_slow"
                 
                 generation_time = time.time() - start_time
                 print(f"   ✅ AI SUCCESS on attempt {attempt+1} ({generation_time:.1f}s)")
                 
+                # Only AI lines are cached (the body is rebuilt from current config on every hit);
+                # fallbacks should get another AI try next run
+                self._cache_put(cache_key, {"lines": lines, "method": method})
+                
                 return {
                     "original_index": index,
                     "prospect": prospect,
-                    "subject": subject,
-                    "body": body,
+                    **self._compose_ai_email(prospect, lines),
                     "method": method,
                     "generation_time": f"{generation_time:.1f}s",
+                    "generation_seconds": generation_time,
                     "generated_at": datetime.now().isoformat(),
                     "sent": False
                 }
                 
             except requests.exceptions.Timeout:
                 print(f"   ⏰ AI timeout on attempt {attempt+1}")
+                self._record_ai_time(timeout)   # At least this slow
                 continue
             except Exception as e:
                 print(f"   ❌ AI error on attempt {attempt+1}: {e}")
@@ -793,25 +1218,95 @@ Overall Status: {self.config.get_config_status()}
             "body": body,
             "method": "fallback",
             "generation_time": f"{generation_time:.1f}s",
+            "generation_seconds": generation_time,
             "generated_at": datetime.now().isoformat(),
             "sent": False
         }
         
+    def _record_ai_time(self, seconds):
+        """Remember how long an Ollama call took (or at least took, on timeout)"""
+        with self._ai_times_lock:
+            self._recent_ai_times.append(seconds)
+
+    def _ollama_is_slow(self):
+        """True once the recent p90 call time is beyond the fast timeout"""
+        with self._ai_times_lock:
+            samples = list(self._recent_ai_times)
+        if len(samples) < AI_SLOW_MIN_SAMPLES:
+            return False
+        return statistics.quantiles(samples, n=10)[8] > self.ai_timeout_fast
+
+    def _shared_ai_lines(self, prospect):
+        """AI lines already written for this prospect's category and city, with its name filled in"""
+        if not self.reuse_ai_lines:
+            return None
+        with self._shared_lines_lock:
+            lines = self._shared_lines.get((prospect.category, prospect.city.strip().lower()))
+        if lines is None:
+            return None
+        return tuple(line.replace(COMPANY_SLOT, prospect.company) for line in lines)
+
+    def _share_ai_lines(self, prospect, opening, benefit, action):
+        """Keep parsed AI lines for later prospects in the same category and city"""
+        if not self.reuse_ai_lines or not prospect.company:
+            return
+        lines = tuple(line.replace(prospect.company, COMPANY_SLOT) for line in (opening, benefit, action))
+        # Only share lines whose company reference was slotted out; anything else may still
+        # name this company in another form (abbreviated, recased, or by its website)
+        if not any(COMPANY_SLOT in line for line in lines):
+            return
+        leftovers = [prospect.company.lower()]
+        if prospect.website:
+            leftovers.append(prospect.website.lower().removeprefix("www."))
+        if any(leftover in line.replace(COMPANY_SLOT, "").lower() for line in lines for leftover in leftovers):
+            return
+        with self._shared_lines_lock:
+            self._shared_lines.setdefault((prospect.category, prospect.city.strip().lower()), lines)
+
+    def _cache_get(self, key):
+        """Cached entry for key, or None (also once the cache is closed)"""
+        with self._cache_lock:
+            return None if self._cache_closed else self._cache.get(key)
+
+    def _cache_put(self, key, value):
+        """Store an entry unless the app is closing and the cache is already shut"""
+        with self._cache_lock:
+            if not self._cache_closed:
+                self._cache[key] = value
+
+    def _email_cache_key(self, prospect):
+        """SHA-256 of everything that shapes a prospect's AI lines"""
+        parts = [prospect.company, prospect.category, prospect.city, prospect.website]
+        parts += [self.config.get('company', 'name'), self.config.get('ollama', 'model'), EMAIL_TEMPLATE_VERSION]
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def _on_close(self):
+        """Flush the email cache and close open connections before exiting"""
+        self.cancel_event.set()
+        # Workers may still be finishing a request; their cache reads/writes become no-ops
+        with self._cache_lock:
+            self._cache_closed = True
+            self._cache.close()
+        self._send_current_queue.put(None)
+        self._close_smtp_pool()
+        self.root.destroy()
+
     def _generate_worker_sequential(self):
-        """Sequential generation to keep model hot"""
+        """Sequential generation, one request in flight (max_workers = 1)"""
         total = len(self.prospects)
         ai_success = 0
         fallback_used = 0
         failed = 0
+        reused = 0
         
         print(f"\n🚀 SEQUENTIAL AI GENERATION - Target: {total} AI emails")
         print("=" * 60)
         
-        for i, prospect in enumerate(self.prospects):
+        for i, prospect in enumerate(self._iter_prospects()):
             if self.cancel_event.is_set():
                 break
             
-            company_name = prospect.get("Company Name", "Unknown")
+            company_name = prospect.company
             print(f"\n📧 Email {i+1}/{total}: {company_name}")
             
             try:
@@ -824,6 +1319,9 @@ Overall Status: {self.config.get_config_status()}
                 if method in ["ai_fast", "ai_slow"]:
                     ai_success += 1
                     print(f"   🎉 AI SUCCESS ({method}) for {company_name}")
+                elif method == "ai_reused":
+                    reused += 1
+                    print(f"   ♻️ AI lines reused for {company_name}")
                 elif method == "fallback":
                     fallback_used += 1
                     print(f"   📝 TEMPLATE used for {company_name}")
@@ -840,11 +1338,8 @@ Overall Status: {self.config.get_config_status()}
                     "message": f"AI: {ai_success}, Templates: {fallback_used} - {company_name}"
                 })
                 
-                # Keep model warm between requests
-                if i < total - 1:
-                    print(f"   ⏸️ Keeping model warm...")
-                    time.sleep(1)  # Brief pause
-                
+            except CancelledError:
+                break
             except Exception as e:
                 print(f"❌ Processing error for {company_name}: {e}")
                 failed += 1
@@ -855,16 +1350,45 @@ Overall Status: {self.config.get_config_status()}
         print(f"   ❌ Failed: {failed}/{total}")
         
         # Send completion
-        self.result_queue.put({
-            "type": "generation_complete",
-            "results": {
-                "ai_success": ai_success,
-                "fallback_used": fallback_used,
-                "failed": failed,
-                "total": len(self.emails)
-            }
-        })
+        self._post_generation_complete(ai_success, fallback_used, failed, reused)
     
+    def _post_generation_complete(self, ai_success, fallback_used, failed, reused=0):
+        """Post the completion event, with its summary text built here rather than on the Tk thread"""
+        results = {
+            "ai_success": ai_success,
+            "fallback_used": fallback_used,
+            "failed": failed,
+            "reused": reused,
+            "total": len(self.emails),
+            **self._timing_summary()
+        }
+        
+        lines = [
+            f"Generated {results['total']} emails!",
+            "",
+            f"🤖 AI Generated: {ai_success}",
+            f"📝 Smart Fallbacks: {fallback_used}",
+        ]
+        if reused > 0:
+            lines.append(f"♻️ Reused AI Lines: {reused}")
+        if failed > 0:
+            lines.append(f"❌ Failed: {failed}")
+        lines += [
+            f"⏱️ Avg {results['mean_time']:.1f}s per email (p95 {results['p95_time']:.1f}s)",
+            "",
+            "All emails ready for review and sending!",
+        ]
+        results["summary"] = "\n".join(lines)
+        
+        self.result_queue.put({"type": "generation_complete", "results": results})
+
+    def _timing_summary(self):
+        """Timing statistics over the generated emails for the completion event"""
+        # Reused lines took no generation time; counting them would flatter the averages
+        times = [email["generation_seconds"] for email in self.emails if email["method"] != "ai_reused"]
+        mean_time, p95_time = summarize_generation_times(times)
+        return {"mean_time": float(mean_time), "p95_time": float(p95_time)}
+
     def _cancel_generation(self):
         """Cancel email generation"""
         self.cancel_event.set()
@@ -876,251 +1400,403 @@ Overall Status: {self.config.get_config_status()}
         ai_success = 0
         fallback_used = 0
         failed = 0
-        
-        # Use single worker to avoid overwhelming slow Ollama
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_prospect = {
-                executor.submit(self._generate_single_email, i, prospect): (i, prospect)
-                for i, prospect in enumerate(self.prospects)
-            }
+        reused = 0
+        
+        # Ollama calls are I/O bound, so several in flight overlap server inference.
+        # Submissions are windowed so a large file never queues every prospect
+        # against the one Ollama server at once.
+        workers = self._generation_workers()
+        window = workers * 2
+        pending_prospects = enumerate(self._iter_prospects())
+        future_to_chunk = {}
+        slots = [None] * total   # Results land at their prospect's index, so no sort is needed
+        current = 0
+        last_progress = 0.0
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def top_up():
+                while len(future_to_chunk) < window and not self.cancel_event.is_set():
+                    chunk = list(islice(pending_prospects, self.batch_size))
+                    if not chunk:
+                        return
+                    future_to_chunk[executor.submit(self._generate_batch, chunk)] = chunk
             
-            # Process completed tasks
-            for future in as_completed(future_to_prospect):
-                if self.cancel_event.is_set():
-                    break
-                
-                i, prospect = future_to_prospect[future]
-                try:
-                    email_data = future.result()
-                    self.emails.append(email_data)
-                    
-                    # Count methods
-                    method = email_data["method"]
-                    if method == "ai_fast" or method == "ai_slow":
-                        ai_success += 1
-                    elif method == "fallback":
-                        fallback_used += 1
-                    else:
-                        failed += 1
-                    
-                    # Update progress
-                    current = len(self.emails)
-                    self.result_queue.put({
-                        "type": "progress",
-                        "current": current,
-                        "total": total,
-                        "message": f"Generated {current}/{total}: {email_data['method']} for {prospect.get('Company Name', 'Unknown')}"
-                    })
-                    
-                except Exception as e:
-                    print(f"Error processing {prospect.get('Company Name', 'Unknown')}: {e}")
-                    failed += 1
+            top_up()
+            while future_to_chunk and not self.cancel_event.is_set():
+                done, _ = wait(future_to_chunk, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = future_to_chunk.pop(future)
+                    try:
+                        for email_data in future.result():
+                            slots[email_data["original_index"]] = email_data
+                            current += 1
+                            
+                            # Count methods
+                            method = email_data["method"]
+                            if method == "ai_fast" or method == "ai_slow":
+                                ai_success += 1
+                            elif method == "ai_reused":
+                                reused += 1
+                            elif method == "fallback":
+                                fallback_used += 1
+                            else:
+                                failed += 1
+                            
+                            # Update progress, coalesced so big batches don't flood the Tk poller
+                            now = time.monotonic()
+                            if now - last_progress >= PROGRESS_MIN_INTERVAL or current == total:
+                                last_progress = now
+                                self.result_queue.put({
+                                    "type": "progress",
+                                    "current": current,
+                                    "total": total,
+                                    "message": f"Generated {current}/{total}: {email_data['method']} for {email_data['prospect'].company}"
+                                })
+                        
+                    except CancelledError:
+                        continue   # Cancelled by the user; not a failure
+                    except Exception as e:
+                        names = ", ".join(prospect.company for _, prospect in chunk)
+                        print(f"Error processing {names}: {e}")
+                        failed += len(chunk)
+                top_up()
+            
+            if self.cancel_event.is_set():
+                # Drop queued work; running tasks stop at their next attempt check
+                executor.shutdown(wait=True, cancel_futures=True)
         
-        # Sort emails by original order
-        self.emails.sort(key=lambda x: x["original_index"])
+        # Already in original order; drop slots left empty by a cancel or failure
+        self.emails = [email_data for email_data in slots if email_data is not None]
         
         # Send completion event
-        self.result_queue.put({
-            "type": "generation_complete",
-            "results": {
-                "ai_success": ai_success,
-                "fallback_used": fallback_used,
-                "failed": failed,
-                "total": len(self.emails)
-            }
-        })
+        self._post_generation_complete(ai_success, fallback_used, failed, reused)
 
-    def _generate_single_email(self, index, prospect):
-        """Generate a single email using hybrid approach"""
-        start_time = time.time()
+    def _generate_batch(self, chunk):
+        """Generate emails for a chunk of (index, prospect) pairs, batching the uncached ones into one Ollama request"""
+        if len(chunk) == 1:
+            return [self._generate_single_email_with_retry(*chunk[0])]
+        
+        # Cached or shareable prospects, duplicates, and keys another worker is generating take
+        # the single path (wait on the key lock, then hit the cache); only the rest are batched
+        singles, batch, held = [], [], []
+        for i, prospect in chunk:
+            cache_key = self._email_cache_key(prospect)
+            with self._cache_lock:
+                key_lock = self._generation_locks.setdefault(cache_key, threading.Lock())
+            if self._cache_get(cache_key) or self._shared_ai_lines(prospect) or not key_lock.acquire(blocking=False):
+                singles.append((i, prospect))
+            else:
+                held.append(key_lock)
+                batch.append((i, prospect, cache_key))
         
+        emails = []
         try:
-            # Try AI generation first (fast timeout)
-            subject, body = self._try_ai_generation(prospect, self.ai_timeout_fast)
-            method = "ai_fast"
-        except (requests.exceptions.Timeout, TimeoutError):
-            try:
-                # Retry with longer timeout
-                subject, body = self._try_ai_generation(prospect, self.ai_timeout_slow)
-                method = "ai_slow"
-            except:
-                # Fall back to smart template
-                subject, body = self._generate_fallback_email(prospect)
-                method = "fallback"
-        except Exception:
-            # Fall back to smart template
-            subject, body = self._generate_fallback_email(prospect)
-            method = "fallback"
-        
-        generation_time = time.time() - start_time
-        
-        return {
-            "original_index": index,
-            "prospect": prospect,
-            "subject": subject,
-            "body": body,
-            "method": method,
-            "generation_time": f"{generation_time:.1f}s",
-            "generated_at": datetime.now().isoformat(),
-            "sent": False
-        }
+            if len(batch) > 1:
+                emails = self._generate_ai_batch(batch)
+            else:
+                singles += [(i, prospect) for i, prospect, _ in batch]
+        finally:
+            for key_lock in held:
+                key_lock.release()
+        
+        if emails is None:
+            # Unparseable or short batch: fall back to one request per prospect
+            emails = []
+            singles += [(i, prospect) for i, prospect, _ in batch]
+        return emails + [self._generate_single_email_with_retry(i, prospect) for i, prospect in singles]
 
-    def _try_ai_generation(self, prospect, timeout):
-        """Try AI generation with specified timeout"""
-        company_name = prospect.get("Company Name", "Your Company")
-        category = prospect.get("Category", "business").lower()
-        city = prospect.get("City", "Louisiana")
-        website = prospect.get("Website", "")
-        
-        # Get industry data for context
-        industry_key = self._map_category_to_industry(category)
-        industry_info = self.industry_data[industry_key]
-        
-        # Create focused prompt for AI with all available data
-        website_context = f"I noticed their website is {website} - " if website else ""
-        
-        prompt = f"""Write 3 short customized lines for {company_name} ({category}) in {city}:
+    def _generate_ai_batch(self, batch):
+        """One JSON request for (index, prospect, cache_key) triples; None if the batch fails"""
+        start_time = time.time()
+        try:
+            results = self._try_ai_generation_batch([prospect for _, prospect, _ in batch],
+                                                    self.ai_timeout_fast * len(batch))
+        except Exception as e:
+            print(f"   🔁 Batch of {len(batch)} failed ({e}) - generating individually")
+            return None
+        
+        per_email = (time.time() - start_time) / len(batch)
+        emails = []
+        for (i, prospect, cache_key), lines in zip(batch, results):
+            self._cache_put(cache_key, {"lines": lines, "method": "ai_fast"})
+            emails.append({
+                "original_index": i,
+                "prospect": prospect,
+                **self._compose_ai_email(prospect, lines),
+                "method": "ai_fast",
+                "generation_time": f"{per_email:.1f}s",
+                "generation_seconds": per_email,
+                "generated_at": datetime.now().isoformat(),
+                "sent": False
+            })
+        return emails
 
-1. Professional opening email line (max 12 words This is the first time Fresh Start Cleaning Louisiana,LLC reach out to the company and this is an opening email) 
-2. Professional Industry-specific benefits {industry_info['benefits']} (max 15 words how Fresh Start Cleaning is useful to their business)  
-3. Professional Call to action to schedule a call or zoom meeting(max 10 words)
+    def _clamp_batch_size(self, batch_size):
+        """Cap batch_size so a batch's prompt and JSON reply fit the fixed num_ctx"""
+        # num_ctx stays constant across requests (changing it reloads the model), so shrink the batch instead
+        num_ctx = self.config.get('ollama', 'num_ctx') or AI_NUM_CTX
+        max_batch = max(1, (num_ctx - AI_BATCH_PROMPT_TOKENS) // (AI_NUM_PREDICT + AI_BATCH_TOKENS_PER_PROSPECT))
+        if batch_size > max_batch:
+            print(f"⚠️ ollama.batch_size {batch_size} does not fit num_ctx {num_ctx}; using {max_batch}")
+            return max_batch
+        return batch_size
 
-Company: {company_name}
-Category: {category}
-City: {city}
-{f"Website: {website}" if website else ""}
+    def _try_ai_generation_batch(self, prospects, timeout):
+        """Ask Ollama for every prospect's three lines in one JSON response"""
+        companies = "\n".join(
+            f"{n}. {p.company} ({p.category}) in {p.city}"
+            for n, p in enumerate(prospects, 1)
+        )
+        prompt = f"""Fresh Start Cleaning Louisiana, LLC is reaching out to these companies for the first time:
+{companies}
 
-Format exactly (no colons in the content):
-OPEN: [opening line]
-BENEFIT: [why cleaning matters for this category]
-ACTION: [meeting request]
+For each company write three short professional lines:
+- open: opening email line (max 12 words)
+- benefit: why professional cleaning matters for their category (max 15 words)
+- action: call to action to schedule a call or zoom meeting (max 10 words)
 
-Example:
-OPEN: Hope your team at Acme Corp is having a productive week
-BENEFIT: Clean workspaces boost productivity and create positive impressions
-ACTION: Could we schedule a brief call about your needs"""
+Return JSON only, in the same order as the list:
+{{"emails": [{{"open": "...", "benefit": "...", "action": "..."}}]}}"""
+        
+        payload = {
+            **self._base_payload(num_predict=AI_NUM_PREDICT * len(prospects)),
+            "prompt": prompt,
+            "format": "json"
+        }
+        items = json.loads(self._ollama_generate_stream(payload, timeout)).get("emails", [])
+        if len(items) != len(prospects):
+            raise ValueError(f"expected {len(prospects)} emails, got {len(items)}")
+        
+        results = []
+        for prospect, item in zip(prospects, items):
+            # Reuse the line parser so batch output gets the same label/punctuation cleanup
+            ai_text = f"OPEN: {item['open']}\nBENEFIT: {item['benefit']}\nACTION: {item['action']}"
+            lines = self._parse_ai_response(ai_text)
+            self._share_ai_lines(prospect, *lines)
+            results.append(lines)
+        return results
+
+    def _try_ai_generation(self, prospect, timeout):
+        """Try AI generation with specified timeout; returns the parsed (opening, benefit, action)"""
+        company_name = prospect.company
+        website = prospect.website
+        
+        # Fill the industry's cached prompt with this prospect's fields
+        prompt = self._prompt_templates[prospect.industry_key].format(
+            company_name=company_name,
+            category=prospect.category,
+            city=prospect.city,
+            website_line=f"Website: {website}" if website else ""
+        )
 
         # Make AI request
         ollama_config = self.config.get("ollama")
         payload = {
-            "model": ollama_config["model"],
+            # Stop server-side too if the model starts writing another example after its three lines
+            **self._base_payload(stop=AI_STOP_SEQUENCES),
             "prompt": prompt,
-            "stream": False
+            "stream": True
         }
         
-        response = self.session.post(
-            ollama_config["url"],
-            json=payload,
-            timeout=timeout
-        )
-        response.raise_for_status()
-        
-        ai_text = response.json().get("response", "").strip()
+        ai_text = self._stream_ai_response(ollama_config["url"], payload, timeout, company_name)
         if hasattr(self, 'debug_mode') and self.debug_mode:
             print(f"   📝 Full AI response: {repr(ai_text)}")
         opening, benefit, action = self._parse_ai_response(ai_text)
-        
-        # Generate email using AI customizations
-        subject = f"Professional Cleaning Services for {company_name}"
-        body = self._build_email_body(prospect, industry_info, opening, benefit, action)
-        
-        return subject, body
+        self._share_ai_lines(prospect, opening, benefit, action)
+        return opening, benefit, action
+
+    def _compose_ai_email(self, prospect, lines):
+        """Subject and body for a prospect from AI (opening, benefit, action) lines"""
+        return {
+            "subject": f"Professional Cleaning Services for {prospect.company}",
+            "body": self._build_email_body(prospect, *lines)
+        }
 
 
+    def _base_payload(self, **options):
+        """Fields shared by every generate request; keyword args override the default options"""
+        ollama_config = self.config.get("ollama")
+        keep_alive = ollama_config.get("keep_alive")
+        return {
+            "model": ollama_config["model"],
+            # Keep the model resident between prospects (-1 = until Ollama stops)
+            "keep_alive": -1 if keep_alive is None else keep_alive,
+            # Same num_ctx on every request, warmups included: changing it makes Ollama reload the model
+            "options": {
+                "num_ctx": ollama_config.get("num_ctx") or AI_NUM_CTX,
+                "num_predict": AI_NUM_PREDICT,
+                **options
+            }
+        }
+
+    def _ollama_generate_stream(self, payload, timeout, session=None):
+        """POST a streaming generate request and return the concatenated response text"""
+        session = session or self._worker_session()
+        parts = []
+        # Parse the NDJSON body line by line; the whole body is not one JSON document
+        with session.post(self.config.get("ollama", "url"), json={**payload, "stream": True},
+                          timeout=(AI_CONNECT_TIMEOUT, timeout), stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+        return "".join(parts)
+
+    def _stream_ai_response(self, url, payload, timeout, company_name):
+        """Stream an Ollama generation, stopping once the ACTION line is complete"""
+        deadline = time.monotonic() + timeout
+        parts = []
+        try:
+            # Separate connect timeout so an unreachable server fails fast instead of using the whole budget
+            with self._worker_session().post(url, json=payload, timeout=(AI_CONNECT_TIMEOUT, timeout),
+                                             stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if time.monotonic() > deadline:
+                        raise requests.exceptions.Timeout(f"AI response exceeded {timeout}s")
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    token = chunk.get("response", "")
+                    if token and not parts:
+                        self.result_queue.put({"type": "status", "message": f"✍️ Receiving AI text for {company_name}..."})
+                    parts.append(token)
+                    if chunk.get("done"):
+                        break
+                    # All three lines are in once ACTION is followed by a newline
+                    if "\n" in token and AI_ACTION_DONE_RE.search("".join(parts)):
+                        break
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            # Out of time or stalled mid-stream (read timeouts surface as ConnectionError
+            # while streaming): keep the partial text if it already has all three lines
+            partial = "".join(parts)
+            labelled = {label for label, text in AI_LINE_RE.findall(partial) if text.strip()}
+            if parts and labelled == AI_LABELS:
+                return partial.strip()
+            raise
+        return "".join(parts).strip()
+
     def _generate_fallback_email(self, prospect):
         """Generate email using smart templates"""
-        company_name = prospect.get("Company Name", "Your Company")
-        category = prospect.get("Category", "business").lower()
-        
-        # Get industry-specific template
-        industry_key = self._map_category_to_industry(category)
-        industry_info = self.industry_data[industry_key]
+        company_name = prospect.company
+        industry_key = prospect.industry_key
         
         # Use fallback content
-        opening = industry_info['fallback_opening'].format(company_name=company_name)
-        benefit = industry_info['fallback_benefit']
-        action = industry_info['fallback_action']
+        opening = self._render_fallback(industry_key, 'fallback_opening', company_name)
+        benefit = self._render_fallback(industry_key, 'fallback_benefit', company_name)
+        action = self._render_fallback(industry_key, 'fallback_action', company_name)
         
         subject = f"Professional Cleaning Services for {company_name}"
-        body = self._build_email_body(prospect, industry_info, opening, benefit, action)
+        body = self._build_email_body(prospect, opening, benefit, action)
         
         return subject, body
 
-    def _build_email_body(self, prospect, industry_info, opening, benefit, action):
+    def _build_email_body(self, prospect, opening, benefit, action):
         """Build email body using customizations and industry data"""
-        company_name = prospect.get("Company Name", "Your Company")
-        city = prospect.get("City", "Louisiana")
-        website = prospect.get("Website", "")
+        return self._body_templates[prospect.industry_key].format(
+            company_name=prospect.company,
+            city=prospect.city,
+            opening=opening,
+            benefit_clean=clean_benefit(benefit),
+            action=action
+        )
+
+    def _compile_prompt_templates(self):
+        """Per-industry AI prompts with the industry benefits filled in.
+
+        Everything fixed comes first and the prospect's fields come last, so
+        consecutive requests share a long prompt prefix that Ollama can serve
+        from the KV cache of the previous request.
+        """
+        templates = {}
+        for industry_key, industry_info in self.industry_data.items():
+            benefits = industry_info['benefits'].replace('{', '{{').replace('}', '}}')
+            templates[industry_key] = f"""Write 3 short customized lines for the company described at the end:
+
+1. Professional opening email line (max 12 words This is the first time Fresh Start Cleaning Louisiana,LLC reach out to the company and this is an opening email) 
+2. Professional Industry-specific benefits {benefits} (max 15 words how Fresh Start Cleaning is useful to their business)  
+3. Professional Call to action to schedule a call or zoom meeting(max 10 words)
+
+Format exactly (no colons in the content):
+OPEN: [opening line]
+BENEFIT: [why cleaning matters for this category]
+ACTION: [meeting request]
+
+Example:
+OPEN: Hope your team at Acme Corp is having a productive week
+BENEFIT: Clean workspaces boost productivity and create positive impressions
+ACTION: Could we schedule a brief call about your needs
+
+Company: {{company_name}}
+Category: {{category}}
+City: {{city}}
+{{website_line}}"""
+        return templates
+
+    def _compile_body_templates(self):
+        """Per-industry email body skeletons with the invariant parts (services, signature) filled in"""
         company_config = self.config.get_company_info()
         
-        # Build service list
-        services = industry_info['services']
-        service_list = '\n'.join(f"• {service}" for service in services[:4])
+        def literal(text):
+            return str(text).replace('{', '{{').replace('}', '}}')
         
-        # Clean up benefit text - remove colons and extra punctuation
-        benefit_clean = benefit.strip()
-        if benefit_clean.startswith(':'):
-            benefit_clean = benefit_clean[1:].strip()
-        if benefit_clean.endswith(':'):
-            benefit_clean = benefit_clean[:-1].strip()
-        
-        # Ensure proper capitalization
-        if benefit_clean and not benefit_clean[0].isupper():
-            benefit_clean = benefit_clean[0].upper() + benefit_clean[1:]
-        
-        # Ensure proper ending punctuation
-        if benefit_clean and not benefit_clean.endswith('.'):
-            benefit_clean += '.'
-
-        # Build location context
-        location_context = f"We're based locally and serve businesses throughout {city} and the surrounding Louisiana area."
-        
-        # Build website reference if available
-        # website_reference = f"I had a chance to look at {website} and " if website else ""
-
-        body = f"""Dear {company_name},
+        templates = {}
+        for industry_key, industry_info in self.industry_data.items():
+            service_list = '\n'.join(f"• {service}" for service in industry_info['services'][:4])
+            templates[industry_key] = f"""Dear {{company_name}},
 
-{opening}
+{{opening}}
 
-Fresh Start Cleaning Louisiana, LLC. specializes in professional cleaning for businesses like {company_name}. {benefit_clean}
+Fresh Start Cleaning Louisiana, LLC. specializes in professional cleaning for businesses like {{company_name}}. {{benefit_clean}}
 
 Our services include:
-{service_list}
+{literal(service_list)}
 
-{location_context} With over 5+ years of experience serving Louisiana businesses, we're licensed, bonded, and insured. Our local team provides reliable, professional service tailored to your specific needs.
+We're based locally and serve businesses throughout {{city}} and the surrounding Louisiana area. With over 5+ years of experience serving Louisiana businesses, we're licensed, bonded, and insured. Our local team provides reliable, professional service tailored to your specific needs.
 
-{action}
+{{action}}
 
 Best regards,
 Fresh Start Cleaning Louisiana, LLC.
-{company_config.get('phone', '')}
-{company_config.get('website', '')}"""
-
-        return body
-
-    def _map_category_to_industry(self, category):
-        """Map category string to industry category"""
-        category = category.lower()
-        
-        if any(word in category for word in ['education', 'preschool', 'school', 'academy', 'college', 'university', 'campus', 'steam']):
-            return 'education'
-        elif any(word in category for word in ['construction', 'building', 'contractor', 'builder', 'plumbing', 'hvac', 'realty']):
-            return 'construction'
-        elif any(word in category for word in ['technology', 'tech', 'software', 'it', 'startup', 'computer']):
-            return 'technology'
-        elif any(word in category for word in ['manufacturing', 'industrial', 'factory', 'plant']):
-            return 'manufacturing'
-        elif any(word in category for word in ['residential', 'home', 'house', 'apartment', 'family']):
-            return 'residential'
-        elif any(word in category for word in ['office', 'professional services', 'consulting', 'consultant']):
-            return 'professional_services'
-        elif any(word in category for word in ['food', 'beverage', 'restaurant', 'cafe', 'coffee', 'roaster']):
-            return 'food_beverage'
-        elif any(word in category for word in ['retail', 'store', 'shop', 'market']):
-            return 'retail'
+{literal(company_config.get('phone', ''))}
+{literal(company_config.get('website', ''))}"""
+        return templates
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _map_category_to_industry(category):
+        """Map category string to industry category (memoized; prospect lists repeat categories)"""
+        matches = [INDUSTRY_KEYWORD_RANK[m.group()] for m in INDUSTRY_KEYWORD_RE.finditer(category.lower())]
+        return min(matches)[1] if matches else 'default'
+
+    def _fill_industry_keys(self, df):
+        """Set "Industry Key" only on rows where it is missing or not a known industry"""
+        if "Industry Key" in df.columns:
+            df["Industry Key"] = df["Industry Key"].astype(str).str.strip()
+            mask = ~df["Industry Key"].isin(self.industry_data.keys())
         else:
-            return 'default'
+            mask = df["Category"].notna()   # All rows (na_filter=False leaves no NaN)
+        if mask.any():
+            df.loc[mask, "Industry Key"] = self._map_categories_to_industries(df.loc[mask, "Category"])
+        return df
+
+    def _canon_industry(self, raw):
+        """Canonicalize a raw category string to an industry_data key"""
+        normalized = str(raw).lower().strip()
+        industry_key = self._industry_alias.get(normalized)
+        if industry_key is None:
+            industry_key = self._map_category_to_industry(normalized)
+        return industry_key
+
+    def _map_categories_to_industries(self, categories):
+        """Map a pandas Series of categories to industry keys, scanning each distinct value once"""
+        categories = categories.fillna("").astype(str)
+        mapping = {category: self._canon_industry(category) for category in categories.unique()}
+        return categories.map(mapping).to_numpy()
 
     def _handle_generation_complete(self, results):
         """Handle completion of email generation"""
@@ -1134,7 +1810,8 @@ Fresh Start Cleaning Louisiana, LLC.
         total = results["total"]
         
         # Update status
-        self.gen_status.config(text=f"✅ AI: {ai_success} | 📝 Fallback: {fallback_used} | ❌ Failed: {failed}")
+        self.gen_status.config(text=f"✅ AI: {ai_success} | ♻️ Reused: {results['reused']} | "
+                                    f"📝 Fallback: {fallback_used} | ❌ Failed: {failed}")
         self.progress_label.config(text="Complete!")
         
         if self.emails:
@@ -1142,15 +1819,8 @@ Fresh Start Cleaning Louisiana, LLC.
             self._display_current_email()
             self._refresh_results_tree()
             
-            # Show summary
-            summary = f"Generated {total} emails!\n\n"
-            summary += f"🤖 AI Generated: {ai_success}\n"
-            summary += f"📝 Smart Fallbacks: {fallback_used}\n"
-            if failed > 0:
-                summary += f"❌ Failed: {failed}\n"
-            summary += f"\nAll emails ready for review and sending!"
-            
-            messagebox.showinfo("Generation Complete", summary)
+            # Show summary (built by the worker)
+            messagebox.showinfo("Generation Complete", results["summary"])
         
         self.status_bar.config(text=f"✅ Generated {total} emails - {ai_success} AI, {fallback_used} fallback")
 
@@ -1160,19 +1830,11 @@ Fresh Start Cleaning Louisiana, LLC.
             return
         
         email = self.emails[self.current_idx]
-        company_name = email["prospect"].get("Company Name", "Unknown")
+        company_name = email["prospect"].company
         method = email["method"]
         time_taken = email["generation_time"]
         
-        # Method icons
-        method_icons = {
-            "ai_fast": "🤖⚡",
-            "ai_slow": "🤖🐌", 
-            "fallback": "📝",
-            "failed": "❌"
-        }
-        
-        icon = method_icons.get(method, "📧")
+        icon = METHOD_ICONS.get(method, "📧")
         self.email_counter.config(text=f"{icon} Email {self.current_idx + 1} of {len(self.emails)} - {company_name} ({time_taken})")
         
         # Load content
@@ -1181,6 +1843,11 @@ Fresh Start Cleaning Louisiana, LLC.
         
         self.email_text.delete(1.0, tk.END)
         self.email_text.insert(1.0, email["body"])
+        
+        # Start clean so _save_current_edits only copies back what the user changed
+        self.email_text.edit_modified(False)
+        self.subject_entry.selection_clear()
+        self._subject_modified = False
 
     def _prev_email(self):
         """Navigate to previous email"""
@@ -1200,36 +1867,61 @@ Fresh Start Cleaning Louisiana, LLC.
             self.current_idx += 1
             self._display_current_email()
 
+    def _on_subject_modified(self, *_):
+        self._subject_modified = True
+
     def _save_current_edits(self):
-        """Save current email edits"""
-        if self.emails:
-            email = self.emails[self.current_idx]
-            email["subject"] = self.subject_entry.get()
+        """Save current email edits (skips the widget copy when nothing changed)"""
+        if not self.emails:
+            return
+        email = self.emails[self.current_idx]
+        if self._subject_modified:
+            email["subject"] = self.subject_var.get()
+            self._subject_modified = False
+        if self.email_text.edit_modified():
             email["body"] = self.email_text.get(1.0, tk.END).strip()
+            self.email_text.edit_modified(False)
 
     def _refresh_results_tree(self):
-        """Refresh the results tree"""
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        for email in self.emails:
-            method_display = {
-                "ai_fast": "🤖⚡ AI Fast",
-                "ai_slow": "🤖🐌 AI Slow",
-                "fallback": "📝 Smart Template",
-                "failed": "❌ Failed"
-            }.get(email["method"], email["method"])
-            
-            status = "✅ Sent" if email.get("sent") else "📝 Draft"
-            
-            values = (
-                email["prospect"].get("Company Name", "")[:25],
-                email["prospect"].get("Email", "")[:30],
-                method_display,
-                status,
-                email["generation_time"]
-            )
-            self.results_tree.insert("", "end", values=values)
+        """Sync the results tree with self.emails, touching only rows that changed"""
+        children = self.results_tree.get_children()
+        stale = children[len(self.emails):]
+        if stale:
+            self.results_tree.delete(*stale)
+        
+        if not children:
+            # Fresh results: bulk insert with columns hidden so Tk lays out once
+            self.results_tree.configure(displaycolumns=())
+            try:
+                for i in range(len(self.emails)):
+                    self.results_tree.insert("", "end", iid=str(i), values=self._result_row_values(i))
+            finally:
+                self.results_tree.configure(displaycolumns="#all")
+            return
+        
+        for i in range(len(self.emails)):
+            self._update_result_row(i)
+
+    def _result_row_values(self, i):
+        """Results tree values for self.emails[i]; ttk clips long text to the column width"""
+        email = self.emails[i]
+        status = "✅ Sent" if email.get("sent") else "📝 Draft"
+        return (
+            email["prospect"].company,
+            email["prospect"].email,
+            METHOD_DISPLAY.get(email["method"], email["method"]),
+            status,
+            email["generation_time"]
+        )
+
+    def _update_result_row(self, i):
+        """Insert or update the results row for self.emails[i] (row iid is the index)"""
+        values = self._result_row_values(i)
+        iid = str(i)
+        if not self.results_tree.exists(iid):
+            self.results_tree.insert("", "end", iid=iid, values=values)
+        elif self.results_tree.item(iid, "values") != values:
+            self.results_tree.item(iid, values=values)
 
     def _send_current(self):
         """Send current email"""
@@ -1244,18 +1936,52 @@ Fresh Start Cleaning Louisiana, LLC.
         self._save_current_edits()
         email = self.emails[self.current_idx]
         
-        company_name = email["prospect"].get("Company Name", "Unknown")
-        recipient = email["prospect"].get("Email", "")
+        company_name = email["prospect"].company
+        recipient = email["prospect"].email
         
         if messagebox.askyesno("Confirm Send", f"Send email to {recipient} ({company_name})?"):
-            success = self._send_email(email)
-            if success:
-                email["sent"] = True
-                email["sent_at"] = datetime.now().isoformat()
-                self._refresh_results_tree()
-                messagebox.showinfo("Success", f"✅ Email sent to {company_name}!")
-            else:
-                messagebox.showerror("Error", "❌ Failed to send email. Check configuration.")
+            # SMTP connect/login/send can take seconds, so keep it off the UI thread
+            self.status_bar.config(text=f"📤 Sending email to {company_name}...")
+            if self._send_current_thread is None:
+                self._send_current_thread = threading.Thread(target=self._send_current_loop, daemon=True)
+                self._send_current_thread.start()
+            self._send_current_queue.put((self.current_idx, email))
+
+    def _send_current_loop(self):
+        """One long-lived sender for Send Current, so its SMTP session carries over between clicks"""
+        while True:
+            try:
+                item = self._send_current_queue.get(timeout=SMTP_IDLE_CLOSE_SECONDS)
+            except queue.Empty:
+                # Don't keep an idle login open; the next send reconnects
+                self._close_smtp()
+                continue
+            if item is None:
+                break
+            self._send_current_worker(*item)
+        self._close_smtp()
+
+    def _send_current_worker(self, index, email):
+        """Send one email and report back through the result queue"""
+        success = self._send_email(email)
+        if success:
+            email["sent"] = True
+            email["sent_at"] = datetime.now().isoformat()
+        self.result_queue.put({"type": "send_current_complete", "index": index, "email": email, "success": success})
+
+    def _on_send_current_complete(self, event):
+        """Report a finished single send"""
+        index, email = event["index"], event["email"]
+        company_name = email["prospect"].company
+        if event["success"]:
+            # The list may have been replaced (new project) while the send was in flight
+            if index < len(self.emails) and self.emails[index] is email:
+                self._update_result_row(index)
+            self.status_bar.config(text=f"✅ Email sent to {company_name}")
+            messagebox.showinfo("Success", f"✅ Email sent to {company_name}!")
+        else:
+            self.status_bar.config(text=f"❌ Failed to send email to {company_name}")
+            messagebox.showerror("Error", "❌ Failed to send email. Check configuration.")
 
     def _send_all(self):
         """Send all unsent emails"""
@@ -1273,47 +1999,180 @@ Fresh Start Cleaning Louisiana, LLC.
             return
         
         if messagebox.askyesno("Confirm Send All", f"Send {len(unsent)} unsent emails?"):
-            sent_count = 0
-            for email in unsent:
-                if self._send_email(email):
-                    email["sent"] = True
-                    email["sent_at"] = datetime.now().isoformat()
-                    sent_count += 1
-                time.sleep(1)  # Small delay between sends
-            
-            self._refresh_results_tree()
-            messagebox.showinfo("Batch Send Complete", f"✅ Sent {sent_count} out of {len(unsent)} emails.")
+            self.status_bar.config(text=f"📤 Sending {len(unsent)} emails...")
+            threading.Thread(target=self._send_all_worker, args=(unsent,), daemon=True).start()
+
+    def _send_all_worker(self, unsent):
+        """Send a batch on a small pool; each worker thread keeps its own SMTP session"""
+        # email.send_delay spaces sends for providers with per-minute limits
+        send_delay = self.config.get('email', 'send_delay')
+        if send_delay is None:
+            send_delay = SMTP_SEND_DELAY
+        workers = self.config.get('email', 'smtp_workers') or SMTP_WORKERS
+        batch_sessions = set()   # Sessions opened by this batch's threads; a concurrent single send keeps its own
+        
+        def send(email):
+            if send_delay:
+                self._wait_for_send_slot(send_delay)
+            try:
+                return self._send_email(email)
+            finally:
+                server = getattr(self._smtp_local, "server", None)
+                if server is not None:
+                    with self._smtp_lock:
+                        batch_sessions.add(server)
+        
+        sent_count = 0
+        done_count = 0
+        last_progress = 0.0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(send, email): email for email in unsent}
+                for future in as_completed(futures):
+                    email = futures[future]
+                    done_count += 1
+                    if future.result():
+                        email["sent"] = True
+                        email["sent_at"] = datetime.now().isoformat()
+                        sent_count += 1
+                    now = time.monotonic()
+                    if now - last_progress >= PROGRESS_MIN_INTERVAL or done_count == len(unsent):
+                        last_progress = now
+                        self.result_queue.put({
+                            "type": "progress",
+                            "current": done_count,
+                            "total": len(unsent),
+                            "message": f"📤 Sent {sent_count}/{len(unsent)}"
+                        })
+        finally:
+            self._close_smtp_pool(batch_sessions)
+        
+        self.result_queue.put({"type": "send_complete", "sent": sent_count, "total": len(unsent)})
+
+    def _on_send_complete(self, event):
+        """Report a finished batch send"""
+        self._refresh_results_tree()
+        self.status_bar.config(text=f"✅ Sent {event['sent']} out of {event['total']} emails")
+        messagebox.showinfo("Batch Send Complete", f"✅ Sent {event['sent']} out of {event['total']} emails.")
+
+    def _get_smtp(self):
+        """Return this thread's SMTP session, reconnecting if it dropped or is due for rotation"""
+        # SMTP modules load on first send, keeping them off the startup path
+        import smtplib
+        
+        server = getattr(self._smtp_local, "server", None)
+        if server is not None and self._smtp_local.sent >= SMTP_MAX_SENDS_PER_CONNECTION:
+            self._close_smtp()
+            server = None
+        
+        # Failed sends close the session, so only a long idle one needs a NOOP health check
+        if server is not None and time.monotonic() - self._smtp_local.last_used < SMTP_IDLE_CHECK_SECONDS:
+            return server
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    self._smtp_local.last_used = time.monotonic()
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        email_config = self.config.get_email_config()
+        server = smtplib.SMTP(email_config["smtp_server"], email_config["smtp_port"])
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+        server.login(email_config["from_email"], email_config["from_password"])
+        
+        self._smtp_local.server = server
+        self._smtp_local.sent = 0
+        self._smtp_local.last_used = time.monotonic()
+        with self._smtp_lock:
+            self._smtp_sessions.add(server)
+        return server
+
+    def _close_smtp(self):
+        """Close this thread's SMTP session if one is open"""
+        server = getattr(self._smtp_local, "server", None)
+        self._smtp_local.server = None
+        self._smtp_local.sent = 0
+        if server is not None:
+            self._quit_smtp(server)
+
+    def _close_smtp_pool(self, servers=None):
+        """Close the given SMTP sessions, or every open one whichever thread opened it"""
+        with self._smtp_lock:
+            # Sessions rotated or dropped mid-batch were already quit and forgotten
+            servers = list(self._smtp_sessions if servers is None else self._smtp_sessions & servers)
+        for server in servers:
+            self._quit_smtp(server)
+
+    def _quit_smtp(self, server):
+        """Quit one SMTP session and forget it"""
+        import smtplib
+        
+        with self._smtp_lock:
+            self._smtp_sessions.discard(server)
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    def _wait_for_send_slot(self, send_delay):
+        """Space sends at least send_delay seconds apart across all worker threads"""
+        with self._send_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_send_at)
+            self._next_send_at = slot + send_delay
+        if slot > now:
+            time.sleep(slot - now)
 
     def _send_email(self, email_data):
         """Send a single email via SMTP"""
+        import smtplib
+        from email.message import EmailMessage
+        
         try:
-            email_config = self.config.get_email_config()
-            company_info = self.config.get_company_info()
-            
-            msg = MIMEMultipart()
-            msg["From"] = f"{company_info['name']} <{email_config['from_email']}>"
-            msg["To"] = email_data["prospect"]["Email"]
+            msg = EmailMessage()
+            msg["From"] = self._from_header
+            msg["To"] = email_data["prospect"].email
             msg["Subject"] = email_data["subject"]
+            msg.set_content(email_data["body"])
             
-            body = email_data["body"]
-            msg.attach(MIMEText(body, "plain"))
-            
-            server = smtplib.SMTP(email_config["smtp_server"], email_config["smtp_port"])
-            server.starttls()
-            server.login(email_config["from_email"], email_config["from_password"])
-            server.sendmail(email_config["from_email"], email_data["prospect"]["Email"], msg.as_string())
-            server.quit()
-            
-            return True
+            for attempt in range(SMTP_MAX_RETRIES + 1):
+                try:
+                    server = self._get_smtp()
+                except smtplib.SMTPServerDisconnected:
+                    # Dropped while connecting, before the message went out; safe to try again
+                    if attempt == SMTP_MAX_RETRIES:
+                        raise
+                    print("   🔌 SMTP connection dropped, reconnecting")
+                    self._close_smtp()
+                    continue
+                
+                # A disconnect during send_message is not retried: the server may already
+                # have accepted DATA, and resending could deliver the email twice
+                try:
+                    server.send_message(msg)
+                    self._smtp_local.sent += 1
+                    self._smtp_local.last_used = time.monotonic()
+                    return True
+                except smtplib.SMTPResponseException as e:
+                    if e.smtp_code not in SMTP_TRANSIENT_CODES or attempt == SMTP_MAX_RETRIES:
+                        raise
+                    print(f"   ⏳ SMTP {e.smtp_code}, retrying in {2 ** attempt}s")
+                    self._close_smtp()
+                    time.sleep(2 ** attempt)
         except Exception as e:
             print(f"SMTP Error: {e}")
+            self._close_smtp()
             return False
 
     def _new_project(self):
         """Start a new project"""
         if messagebox.askyesno("New Project", "Clear all current data and start fresh?"):
             self.cancel_event.set()
-            self.prospects = []
+            self.prospects = None
             self.emails = []
             self.current_idx = 0
             self.is_generating = False
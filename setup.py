@@ -15,6 +15,7 @@ def install_requirements():
         'tkinter',  # Usually built-in with Python
         'pandas',
         'requests',
+        'pyarrow',  # Parquet caching/export
         'pyinstaller'  # For creating executable
     ]
     
@@ -45,7 +46,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['pandas', 'tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox', 'tkinter.scrolledtext'],
+    hiddenimports=['pandas', 'pyarrow', 'tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox', 'tkinter.scrolledtext'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -127,6 +128,7 @@ def create_requirements_file():
     """Create requirements.txt file"""
     requirements = """pandas>=1.3.0
 requests>=2.25.0
+pyarrow>=10.0.0
 pyinstaller>=4.0
 """
     
@@ -199,7 +201,7 @@ Your CSV file should include these columns:
 ## Files Created
 
 - `config.json`: Stores your settings
-- `email_results.json`: Email history
+- `history.db`: Sent email history (SQLite)
 - `prospects_template.csv`: Sample CSV format
 
 ## Support